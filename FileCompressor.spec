@@ -55,7 +55,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=False,  # UPX-packed binaries must be unpacked on every launch
     console=False,
     disable_windowed_traceback=True,
     target_arch=None,
@@ -64,18 +64,31 @@ exe = EXE(
     icon='assets/icons/compressor.icns'
 )
 
-app = BUNDLE(
-    exe,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    name='FileCompressor.app',
-    icon='assets/icons/compressor.icns',
-    bundle_identifier='com.filecompressor.app',
-    info_plist={
-        'NSHighResolutionCapable': True,
-        'LSMinimumSystemVersion': '10.13.0',
-        'CFBundleDisplayName': 'FileCompressor',
-        'NSPrincipalClass': 'NSApplication',
-    }
-)
\ No newline at end of file
+# One-dir build: binaries are collected next to the executable rather than
+# unpacked from a one-file archive at every launch
+if platform.system() == 'Darwin':
+    app = BUNDLE(
+        exe,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        name='FileCompressor.app',
+        icon='assets/icons/compressor.icns',
+        bundle_identifier='com.filecompressor.app',
+        info_plist={
+            'NSHighResolutionCapable': True,
+            'LSMinimumSystemVersion': '10.13.0',
+            'CFBundleDisplayName': 'FileCompressor',
+            'NSPrincipalClass': 'NSApplication',
+        }
+    )
+else:
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.zipfiles,
+        a.datas,
+        strip=False,
+        upx=False,
+        name='FileCompressor'
+    )
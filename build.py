@@ -9,6 +9,8 @@ import sys
 import platform
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 
 def run_command(command, description):
@@ -62,11 +64,14 @@ def check_dependencies():
     
     missing_packages = []
     
-    for package_name, import_name in required_packages:
-        try:
-            __import__(import_name)
+    # find_spec only locates the package, so heavy imports like PIL/PyInstaller aren't executed
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(lambda p: (p[0], find_spec(p[1]) is not None), required_packages))
+    
+    for package_name, found in results:
+        if found:
             print(f"✓ {package_name}")
-        except ImportError:
+        else:
             print(f"✗ {package_name} - MISSING")
             missing_packages.append(package_name)
     
@@ -98,7 +103,7 @@ def build_macos():
     print("📱 Building for macOS...")
     
     # Build with PyInstaller
-    command = "pyinstaller FileCompressor.spec --clean"
+    command = "pyinstaller FileCompressor.spec --clean --noupx"
     if not run_command(command, "Building macOS application"):
         return False
     
@@ -118,7 +123,7 @@ def build_windows():
     print("🪟 Building for Windows...")
     
     # Build with PyInstaller
-    command = "pyinstaller FileCompressor.spec --clean"
+    command = "pyinstaller FileCompressor.spec --clean --noupx"
     if not run_command(command, "Building Windows application"):
         return False
     
@@ -135,7 +140,7 @@ def build_linux():
     print("🐧 Building for Linux...")
     
     # Build with PyInstaller
-    command = "pyinstaller FileCompressor.spec --clean"
+    command = "pyinstaller FileCompressor.spec --clean --noupx"
     if not run_command(command, "Building Linux application"):
         return False
     
@@ -1,9 +1,6 @@
 import os
-import zipfile
-import tempfile
-import shutil
 from typing import Optional, List
-from PIL import Image
+from compressors.office_generic import repack_office_archive
 
 class DOCXCompressor:
     """Handles DOCX compression by optimizing embedded images."""
@@ -23,7 +20,6 @@ class DOCXCompressor:
         Returns:
             Path to compressed DOCX or None if failed
         """
-        temp_dir = tempfile.mkdtemp()
         base_name = os.path.basename(docx_path).replace(".docx", "_compressed.docx")
         
         if out_dir:
@@ -32,36 +28,8 @@ class DOCXCompressor:
             output_path = docx_path.replace(".docx", "_compressed.docx")
 
         try:
-            # Step 1: Unzip .docx (it's just a zip file)
-            with zipfile.ZipFile(docx_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-
-            # Step 2: Compress images in the media folder
-            media_path = os.path.join(temp_dir, "word", "media")
-            if os.path.exists(media_path):
-                for file in os.listdir(media_path):
-                    full_path = os.path.join(media_path, file)
-                    if file.lower().endswith((".png", ".jpg", ".jpeg")):
-                        try:
-                            img = Image.open(full_path)
-                            if file.lower().endswith((".jpg", ".jpeg")):
-                                img = img.convert("RGB")
-                                img.save(full_path, optimize=True, quality=self.jpeg_quality)
-                            elif file.lower().endswith(".png"):
-                                img.save(full_path, optimize=True)
-                        except Exception as e:
-                            msg = f"Failed to compress {file}: {e}"
-                            print(msg)
-                            if error_list is not None:
-                                error_list.append(msg)
-
-            # Step 3: Repackage the .docx
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as docx_zip:
-                for foldername, subfolders, filenames in os.walk(temp_dir):
-                    for filename in filenames:
-                        file_path = os.path.join(foldername, filename)
-                        arcname = os.path.relpath(file_path, temp_dir)
-                        docx_zip.write(file_path, arcname)
+            # Stream the archive into the output, recompressing word/media images on the way
+            repack_office_archive(docx_path, output_path, "word/media", self.jpeg_quality, error_list)
 
             return output_path
             
@@ -70,7 +38,4 @@ class DOCXCompressor:
             print(msg)
             if error_list is not None:
                 error_list.append(msg)
-            return None
-        finally:
-            # Clean up temporary directory
-            shutil.rmtree(temp_dir) 
\ No newline at end of file
+            return None
\ No newline at end of file
@@ -1,12 +1,175 @@
 import os
+import struct
+from io import BytesIO
 from typing import Optional, List
 from PIL import Image
+from config import Config
 
 try:
     import pillow_heif
 except ImportError:
     pillow_heif = None
 
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJPF_RGBA
+    # Raises if the libturbojpeg shared library itself can't be found
+    turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    turbojpeg = None
+
+try:
+    import oxipng
+except ImportError:
+    oxipng = None
+
+# IJG standard luminance quantization table, in the zigzag order DQT segments use
+_STD_LUMINANCE_QTABLE = (
+    16, 11, 12, 14, 12, 10, 16, 14, 13, 14, 18, 17, 16, 19, 24, 40,
+    26, 24, 22, 22, 24, 49, 35, 37, 29, 40, 58, 51, 61, 60, 57, 51,
+    56, 55, 64, 72, 92, 78, 64, 68, 87, 69, 55, 56, 80, 109, 81, 87,
+    95, 98, 103, 104, 103, 62, 77, 113, 121, 112, 100, 120, 92, 101, 103, 99,
+)
+
+def _estimate_jpeg_quality(data: bytes) -> Optional[int]:
+    """
+    Estimate the IJG quality a JPEG was saved with from its luminance quantization table.
+
+    Args:
+        data: JPEG bytes (only the headers up to the first scan are read)
+
+    Returns:
+        Estimated quality (1-100), or None if no luminance table was found
+    """
+    if data[:2] != b'\xff\xd8':
+        return None
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        (length,) = struct.unpack_from('>H', data, pos + 2)
+        if marker == 0xDA:
+            # Start of scan: the quantization tables all come before it
+            return None
+        if marker == 0xDB:
+            seg, end = pos + 4, pos + 2 + length
+            while seg < end:
+                precision, table_id = data[seg] >> 4, data[seg] & 0x0F
+                size = 128 if precision else 64
+                if table_id == 0:
+                    fmt = '>64H' if precision else '64B'
+                    table = struct.unpack_from(fmt, data, seg + 1)
+                    # Invert IJG's scaling: q = (std * scale + 50) / 100
+                    scale = sum(q * 100 / std for q, std in zip(table, _STD_LUMINANCE_QTABLE)) / 64
+                    quality = (200 - scale) / 2 if scale <= 100 else 5000 / scale
+                    return max(1, min(100, round(quality)))
+                seg += 1 + size
+        pos += 2 + length
+    return None
+
+def encode_jpeg(img: Image.Image, quality: int) -> bytes:
+    """
+    Encode an RGB image as JPEG, using libjpeg-turbo when it is available.
+
+    Args:
+        img: RGB image to encode
+        quality: JPEG quality setting (1-100)
+
+    Returns:
+        Encoded JPEG bytes
+    """
+    if turbojpeg is not None:
+        return turbojpeg.encode(np.asarray(img), quality=quality, pixel_format=TJPF_RGB)
+    out = BytesIO()
+    img.save(out, 'JPEG', quality=quality, optimize=True)
+    return out.getvalue()
+
+def recompress_jpeg(data: bytes, quality: int) -> bytes:
+    """
+    Re-encode JPEG bytes at the given quality.
+
+    Sources already saved at or below the target quality are returned untouched,
+    as is the original whenever re-encoding wouldn't make it smaller.
+
+    Args:
+        data: Source JPEG bytes
+        quality: JPEG quality setting (1-100)
+
+    Returns:
+        Re-encoded JPEG bytes, or the original bytes if re-encoding isn't worthwhile
+    """
+    try:
+        estimated = _estimate_jpeg_quality(data)
+    except (struct.error, IndexError):
+        # Truncated headers; let the decoder decide
+        estimated = None
+    if estimated is not None and estimated <= quality:
+        return data
+    out = _encode_jpeg_bytes(data, quality)
+    return out if len(out) < len(data) else data
+
+def _encode_jpeg_bytes(data: bytes, quality: int) -> bytes:
+    """Decode JPEG bytes and encode them again at the given quality."""
+    if turbojpeg is not None:
+        try:
+            # Decode and encode share turbojpeg's default BGR layout, so no swizzle is needed
+            return turbojpeg.encode(turbojpeg.decode(data), quality=quality)
+        except OSError:
+            # e.g. CMYK JPEGs, which libjpeg-turbo can't convert; let Pillow handle them
+            pass
+    img = Image.open(BytesIO(data))
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    return encode_jpeg(img, quality)
+
+def optimize_png(data: bytes) -> bytes:
+    """
+    Losslessly optimize PNG bytes, using oxipng when it is available.
+
+    Args:
+        data: Source PNG bytes
+
+    Returns:
+        Optimized PNG bytes
+    """
+    if oxipng is not None:
+        return oxipng.optimize_from_memory(data, level=Config.PNG_OPTIMIZE_LEVEL)
+    img = Image.open(BytesIO(data))
+    out = BytesIO()
+    img.save(out, 'PNG', optimize=True)
+    # Pillow can grow an already well-compressed PNG
+    return out.getvalue() if out.tell() < len(data) else data
+
+def encode_heic_file(path: str, quality: int) -> bytes:
+    """
+    Decode a HEIC file's primary image and encode it as JPEG.
+
+    With turbojpeg the decoded frame is encoded straight from pillow_heif's
+    buffer, without building an intermediate PIL image.
+
+    Args:
+        path: Path to the HEIC file (requires pillow_heif)
+        quality: JPEG quality setting (1-100)
+
+    Returns:
+        JPEG bytes
+    """
+    # Multi-image HEIC files decode their primary frame; HDR frames are reduced to 8 bits
+    heif = pillow_heif.read_heif(path, convert_hdr_to_8bit=True)
+    pixel_formats = {'RGB': TJPF_RGB, 'RGBA': TJPF_RGBA} if turbojpeg is not None else {}
+    if heif.mode in pixel_formats:
+        # JPEG has no alpha channel; turbojpeg drops it while encoding
+        return turbojpeg.encode(np.asarray(heif), quality=quality, pixel_format=pixel_formats[heif.mode])
+    img = heif.to_pillow()
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    return encode_jpeg(img, quality)
+
 class ImageCompressor:
     """Handles image compression for various formats."""
     
@@ -41,16 +204,19 @@ class ImageCompressor:
                     output_path = image_path.rsplit('.', 1)[0] + '_compressed.png'
 
             if ext in ['.jpg', '.jpeg']:
-                img = Image.open(image_path)
-                img = img.convert('RGB')
-                img.save(output_path, 'JPEG', quality=self.jpeg_quality, optimize=True)
+                with open(image_path, 'rb') as f:
+                    data = recompress_jpeg(f.read(), self.jpeg_quality)
+                with open(output_path, 'wb') as f:
+                    f.write(data)
             elif ext == '.png':
-                img = Image.open(image_path)
-                img.save(output_path, 'PNG', optimize=True)
+                with open(image_path, 'rb') as f:
+                    data = optimize_png(f.read())
+                with open(output_path, 'wb') as f:
+                    f.write(data)
             elif ext == '.heic' and pillow_heif:
-                img = Image.open(image_path)
-                img = img.convert('RGB')
-                img.save(output_path, 'JPEG', quality=self.jpeg_quality, optimize=True)
+                data = encode_heic_file(image_path, self.jpeg_quality)
+                with open(output_path, 'wb') as f:
+                    f.write(data)
             else:
                 raise Exception('Unsupported image format or missing HEIC support')
                 
@@ -1,6 +1,276 @@
-import os, zipfile, tempfile, shutil
-from typing import Optional
-from PIL import Image
+import os, sys, zipfile, shutil, copy, struct, zlib, mmap
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, List, Tuple, Dict, Iterable
+from config import Config
+from compressors.image_compressor import recompress_jpeg, optimize_png
+
+# Local file header layout, as in zipfile.structFileHeader
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_COPY_CHUNK_SIZE = 1 << 20
+# Embedded media formats we recompress, and the subset that are JPEGs
+_MEDIA_IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png"})
+_JPEG_EXTS = frozenset({".jpg", ".jpeg"})
+# Already-compressed formats that gain nothing from deflate, so they are stored as-is
+_STORED_EXTS = frozenset({".jpg", ".jpeg", ".png", ".heic", ".webp"})
+# Largest archive we map into a 32-bit address space
+_MMAP_32BIT_LIMIT = 1 << 30
+
+class _MappedFile:
+    """Read-only file object over an mmap (mmap only gained seekable() in Python 3.13)."""
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+
+    def seekable(self) -> bool:
+        return True
+
+    def __getattr__(self, name):
+        return getattr(self._mapped, name)
+
+@contextlib.contextmanager
+def _open_archive_source(path: str):
+    """Open an archive file for reading, memory-mapped when it fits the address space."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        # Empty files can't be mapped
+        if size == 0 or (sys.maxsize <= 2 ** 32 and size >= _MMAP_32BIT_LIMIT):
+            yield f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield _MappedFile(mapped)
+
+def _copy_raw_member(zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo) -> bool:
+    """
+    Copy an archive member's already-compressed bytes without inflating/deflating them.
+
+    zipfile has no public raw-copy API, so this writes the local header and
+    registers the entry the same way ZipFile.open(..., 'w') does.
+
+    Args:
+        zin: Source archive opened for reading
+        zout: Destination archive opened for writing (seekable)
+        info: Member of zin to copy
+
+    Returns:
+        True if the member was copied, False if the caller must fall back to a normal copy
+    """
+    # Encrypted and ZIP64-sized members keep to the regular code path
+    if info.flag_bits & 0x01 or max(info.file_size, info.compress_size) >= zipfile.ZIP64_LIMIT:
+        return False
+
+    zin.fp.seek(info.header_offset)
+    header = zin.fp.read(_LOCAL_HEADER.size)
+    if len(header) != _LOCAL_HEADER.size:
+        return False
+    fields = _LOCAL_HEADER.unpack(header)
+    if fields[0] != zipfile.stringFileHeader:
+        return False
+    zin.fp.seek(info.header_offset + _LOCAL_HEADER.size + fields[10] + fields[11])
+
+    def read_chunks():
+        remaining = info.compress_size
+        while remaining:
+            chunk = zin.fp.read(min(remaining, _COPY_CHUNK_SIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+            remaining -= len(chunk)
+            yield chunk
+
+    _write_raw_member(zout, copy.copy(info), read_chunks())
+    return True
+
+def _write_raw_member(zout: zipfile.ZipFile, out_info: zipfile.ZipInfo, chunks: Iterable[bytes]) -> None:
+    """
+    Write a member whose compressed bytes, CRC and sizes are already known.
+
+    zipfile has no public API for this, so the local header is written and the
+    entry registered the same way ZipFile.open(..., 'w') does.
+
+    Args:
+        zout: Destination archive opened for writing (seekable)
+        out_info: Member info with compress_type, CRC, compress_size and file_size filled in
+        chunks: The member's compressed data
+    """
+    # Sizes and CRC go in the local header, so no trailing data descriptor is written
+    out_info.flag_bits &= ~0x08
+    zout._writecheck(out_info)
+    zout._didModify = True
+    zout.fp.seek(zout.start_dir)
+    out_info.header_offset = zout.fp.tell()
+    zout.fp.write(out_info.FileHeader(False))
+    for chunk in chunks:
+        zout.fp.write(chunk)
+    zout.start_dir = zout.fp.tell()
+    zout.filelist.append(out_info)
+    zout.NameToInfo[out_info.filename] = out_info
+
+def _deflate(data: bytes, level: Optional[int]) -> Tuple[int, Optional[bytes]]:
+    """
+    Return the CRC-32 and raw (headerless) deflate stream of data; zlib releases the GIL for both.
+
+    With level None only the CRC is computed, for members that will be stored.
+    """
+    if level is None:
+        return zlib.crc32(data), None
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return zlib.crc32(data), compressor.compress(data) + compressor.flush()
+
+def _is_stored(name: str) -> bool:
+    """Check whether an archive member should be stored without deflate."""
+    return os.path.splitext(name)[1].lower() in _STORED_EXTS
+
+def deflate_members_parallel(members: List[Tuple[zipfile.ZipInfo, bytes]],
+                             level: int = Config.ZIP_COMPRESS_LEVEL) -> Dict[str, Tuple[zipfile.ZipInfo, bytes]]:
+    """
+    Deflate archive members on a thread pool, ready to be written with _write_raw_member.
+
+    JPEG/PNG/HEIC/WebP members are stored (ZIP_STORED) rather than deflated.
+
+    Args:
+        members: (info, uncompressed data) pairs; the infos are copied, not modified
+        level: Deflate level (0-9)
+
+    Returns:
+        Mapping of member name to (info with CRC/sizes/compress_type set, compressed bytes).
+        Members too large to write without ZIP64 are left out.
+    """
+    members = [(info, data) for info, data in members if len(data) < zipfile.ZIP64_LIMIT]
+    if not members:
+        return {}
+    max_workers = min(os.cpu_count() or 1, len(members))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        deflated = list(executor.map(
+            lambda member: _deflate(member[1], None if _is_stored(member[0].filename) else level),
+            members))
+
+    prepared = {}
+    for (info, data), (crc, packed) in zip(members, deflated):
+        out_info = copy.copy(info)
+        out_info.CRC = crc
+        out_info.file_size = len(data)
+        if packed is not None and len(packed) < len(data):
+            out_info.compress_type = zipfile.ZIP_DEFLATED
+            # Deflate needs "version needed to extract" 2.0
+            out_info.extract_version = max(out_info.extract_version, 20)
+        else:
+            out_info.compress_type = zipfile.ZIP_STORED
+            packed = data
+        out_info.compress_size = len(packed)
+        prepared[info.filename] = (out_info, packed)
+    return prepared
+
+def _compress_one(data: bytes, name: str, quality: int) -> Tuple[bytes, Optional[str]]:
+    """
+    Compress a single embedded media image held in memory.
+
+    Runs inside a worker process, so it must stay a module-level function.
+
+    Args:
+        data: Raw image bytes read from the archive
+        name: Archive member name (used for format detection and errors)
+        quality: JPEG quality setting (1-100)
+
+    Returns:
+        Tuple of (image bytes, error message). On failure the original bytes are returned with the error.
+    """
+    file = os.path.basename(name)
+    try:
+        if os.path.splitext(file)[1].lower() in _JPEG_EXTS:
+            return recompress_jpeg(data, quality), None
+        # Anything else handed to us is a PNG
+        return optimize_png(data), None
+    except Exception as e:
+        return data, f"Failed to compress {file}: {e}"
+
+def compress_media_entries(zin: zipfile.ZipFile, infos: List[zipfile.ZipInfo], quality: int = 60,
+                           error_list: Optional[List[str]] = None) -> Dict[str, bytes]:
+    """
+    Compress the given JPEG/PNG archive members in parallel.
+
+    Args:
+        zin: Source archive opened for reading
+        infos: Media members to compress
+        quality: JPEG quality setting (1-100)
+        error_list: List to append errors to
+
+    Returns:
+        Mapping of member name to its compressed bytes, for members that changed
+    """
+    if not infos:
+        return {}
+
+    names = [info.filename for info in infos]
+    blobs = [zin.read(info) for info in infos]
+
+    # Spinning up a pool costs more than encoding a single image, and inside a
+    # worker process the caller is already spreading files across the cores
+    if len(infos) == 1:
+        results = [_compress_one(blobs[0], names[0], quality)]
+    elif multiprocessing.parent_process() is not None:
+        results = [_compress_one(blob, name, quality) for blob, name in zip(blobs, names)]
+    else:
+        max_workers = min(os.cpu_count() or 1, len(infos))
+        # Forking a process that already runs threads (batch workers, oxipng's pool) can deadlock
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            results = list(executor.map(_compress_one, blobs, names, [quality] * len(infos)))
+
+    compressed = {}
+    for name, blob, (data, msg) in zip(names, blobs, results):
+        # Untouched images can still be raw-copied from the source archive
+        if data != blob:
+            compressed[name] = data
+        if msg:
+            print(msg)
+            if error_list is not None:
+                error_list.append(msg)
+    return compressed
+
+def repack_office_archive(src_path: str, output_path: str, media_folder_name: str, quality: int = 60,
+                          error_list: Optional[List[str]] = None) -> None:
+    """
+    Copy an Office archive to output_path, recompressing the images in its media folder.
+
+    Recompressed images are deflated in parallel; every other member is
+    copied as raw compressed bytes from the source archive, so nothing is
+    extracted to disk or re-deflated.
+
+    Args:
+        src_path: Path to the source Office file
+        output_path: Path to write the repacked file to
+        media_folder_name: Archive folder holding embedded media ('word/media', 'xl/media', 'ppt/media')
+        quality: JPEG quality setting (1-100)
+        error_list: List to append errors to
+    """
+    media_prefix = media_folder_name.rstrip('/') + '/'
+    # Map the source so the central directory and member reads come straight from the page cache
+    with _open_archive_source(src_path) as src, \
+            zipfile.ZipFile(src, 'r') as zin, \
+            zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED,
+                            compresslevel=Config.ZIP_COMPRESS_LEVEL) as zout:
+        infos = zin.infolist()
+        media = [info for info in infos
+                 if info.filename.startswith(media_prefix)
+                 and os.path.splitext(info.filename)[1].lower() in _MEDIA_IMAGE_EXTS]
+        compressed = compress_media_entries(zin, media, quality, error_list)
+        prepared = deflate_members_parallel([(info, compressed[info.filename])
+                                             for info in infos if info.filename in compressed])
+
+        for info in infos:
+            if info.filename in prepared:
+                out_info, packed = prepared[info.filename]
+                _write_raw_member(zout, out_info, [packed])
+            elif info.filename in compressed:
+                # Copy the ZipInfo so writing doesn't clobber the source header offsets
+                out_info = copy.copy(info)
+                if _is_stored(info.filename):
+                    out_info.compress_type = zipfile.ZIP_STORED
+                zout.writestr(out_info, compressed[info.filename],
+                              compresslevel=Config.ZIP_COMPRESS_LEVEL)
+            elif not _copy_raw_member(zin, zout, info):
+                with zin.open(info) as src, zout.open(copy.copy(info), 'w') as dst:
+                    shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
 
 def compress_office_images(filepath: str, media_folder_name: str, quality: int = 60) -> Optional[str]:
     """
@@ -14,41 +284,14 @@ def compress_office_images(filepath: str, media_folder_name: str, quality: int =
     Returns:
         Path to compressed file or None if failed
     """
-    temp_dir = tempfile.mkdtemp()
     try:
         ext = os.path.splitext(filepath)[1].lower()
         output_path = filepath.replace(ext, f"_compressed{ext}")
 
-        with zipfile.ZipFile(filepath, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
-
-        media_dir = os.path.join(temp_dir, media_folder_name)
-        if os.path.exists(media_dir):
-            for file in os.listdir(media_dir):
-                full_path = os.path.join(media_dir, file)
-                if file.lower().endswith((".jpg", ".jpeg", ".png")):
-                    try:
-                        img = Image.open(full_path)
-                        if file.lower().endswith((".jpg", ".jpeg")):
-                            img = img.convert("RGB")
-                            img.save(full_path, "JPEG", quality=quality, optimize=True)
-                        elif file.lower().endswith(".png"):
-                            img.save(full_path, "PNG", optimize=True)
-                    except Exception as e:
-                        print(f"Failed to compress image in {filepath}: {file} -> {e}")
-
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as new_zip:
-            for foldername, subfolders, filenames in os.walk(temp_dir):
-                for filename in filenames:
-                    abs_path = os.path.join(foldername, filename)
-                    rel_path = os.path.relpath(abs_path, temp_dir)
-                    new_zip.write(abs_path, rel_path)
+        repack_office_archive(filepath, output_path, media_folder_name, quality)
 
         return output_path
         
     except Exception as e:
         print(f"Failed to compress {filepath}: {e}")
-        return None
-    finally:
-        # Clean up temporary directory
-        shutil.rmtree(temp_dir, ignore_errors=True) 
\ No newline at end of file
+        return None 
\ No newline at end of file
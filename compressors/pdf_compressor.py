@@ -1,17 +1,89 @@
 import os
 import subprocess
+import tempfile
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
+from config import Config
+from compressors.image_compressor import recompress_jpeg
 from utils.file_utils import get_ghostscript_path
 
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
+@functools.lru_cache(maxsize=None)
+def _gs_path() -> Optional[str]:
+    """Locate Ghostscript once per process; None if it isn't installed."""
+    path = get_ghostscript_path()
+    if path and os.path.isfile(path) and os.access(path, os.X_OK):
+        return path
+    return None
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Get a file's modification time, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _ps_string(text: str) -> str:
+    """Quote text as a PostScript string literal."""
+    escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return f'({escaped})'
+
 class PDFCompressor:
-    """Handles PDF compression using Ghostscript."""
+    """Handles PDF compression with Ghostscript, falling back to pikepdf in-process."""
     
     def __init__(self):
-        self.gs_path = get_ghostscript_path()
+        self.gs_path = _gs_path()
+    
+    def _output_path(self, pdf_path: str, out_dir: Optional[str] = None) -> str:
+        """Get the output path for a compressed PDF."""
+        base_name = os.path.basename(pdf_path).replace('.pdf', '_compressed.pdf')
+        if out_dir:
+            return os.path.join(out_dir, base_name)
+        return pdf_path.replace('.pdf', '_compressed.pdf')
+    
+    def _compress_with_pikepdf(self, pdf_path: str, output_path: str, quality: str) -> bool:
+        """
+        Recompress embedded JPEG images and streams in-process with pikepdf.
+        
+        Args:
+            pdf_path: Path to input PDF file
+            output_path: Path to write the compressed PDF to
+            quality: PDF quality setting, mapped to a JPEG quality via Config.PDF_JPEG_QUALITY
+            
+        Returns:
+            True if the output is smaller than the input
+        """
+        jpeg_quality = Config.PDF_JPEG_QUALITY.get(quality, Config.DEFAULT_JPEG_QUALITY)
+        with pikepdf.open(pdf_path) as pdf:
+            for obj in pdf.objects:
+                if not isinstance(obj, pikepdf.Stream) or obj.get('/Subtype') != pikepdf.Name.Image:
+                    continue
+                # Only plain 8-bit RGB JPEGs can be swapped for a re-encoded RGB JPEG as-is
+                if (obj.get('/Filter') != pikepdf.Name.DCTDecode
+                        or obj.get('/ColorSpace') != pikepdf.Name.DeviceRGB
+                        or obj.get('/BitsPerComponent') != 8):
+                    continue
+                raw = obj.read_raw_bytes()
+                data = recompress_jpeg(raw, jpeg_quality)
+                if len(data) < len(raw):
+                    obj.write(data, filter=pikepdf.Name.DCTDecode)
+            pdf.remove_unreferenced_resources()
+            pdf.save(output_path, compress_streams=True,
+                     object_stream_mode=pikepdf.ObjectStreamMode.generate)
+        return os.path.getsize(output_path) < os.path.getsize(pdf_path)
     
     def compress(self, pdf_path: str, error_list: Optional[List[str]] = None, out_dir: Optional[str] = None, quality: str = '/screen') -> Optional[str]:
         """
-        Compress PDF using Ghostscript.
+        Compress PDF with Ghostscript, or in-process with pikepdf when Ghostscript
+        isn't installed.
+        
+        pikepdf only re-encodes RGB JPEGs and never downsamples, so it is the
+        fallback rather than the first choice.
         
         Args:
             pdf_path: Path to input PDF file
@@ -23,11 +95,20 @@ class PDFCompressor:
             Path to compressed PDF or None if failed
         """
         try:
-            base_name = os.path.basename(pdf_path).replace('.pdf', '_compressed.pdf')
-            if out_dir:
-                output_path = os.path.join(out_dir, base_name)
-            else:
-                output_path = pdf_path.replace('.pdf', '_compressed.pdf')
+            output_path = self._output_path(pdf_path, out_dir)
+            
+            if not self.gs_path:
+                if pikepdf is None:
+                    raise FileNotFoundError("Ghostscript not found. Install it (e.g. 'brew install ghostscript') to compress PDFs")
+                if self._compress_with_pikepdf(pdf_path, output_path, quality):
+                    return output_path
+                # Don't hand back a "compressed" file that is no smaller than the input
+                os.remove(output_path)
+                msg = f"Could not make PDF {pdf_path} any smaller without Ghostscript"
+                print(msg)
+                if error_list is not None:
+                    error_list.append(msg)
+                return None
                 
             result = subprocess.run([
                 self.gs_path,
@@ -39,7 +120,9 @@ class PDFCompressor:
                 '-dBATCH',
                 f'-sOutputFile={output_path}',
                 pdf_path
-            ], check=True, capture_output=True, text=True)
+            ], check=True, capture_output=True, text=True,
+               # Our fds are non-inheritable anyway; close_fds=False lets CPython use posix_spawn
+               close_fds=False)
             
             return output_path
             
@@ -56,4 +139,92 @@ class PDFCompressor:
             print(msg)
             if error_list is not None:
                 error_list.append(msg)
-            return None 
\ No newline at end of file
+            return None
+    
+    def compress_many(self, pdf_paths: List[str], error_list: Optional[List[str]] = None, out_dir: Optional[str] = None, quality: str = '/screen', max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """
+        Compress several PDFs with concurrent Ghostscript processes.
+        
+        Ghostscript is single-threaded, so one process per core scales with the
+        number of cores. Threads are enough to drive them since each one just
+        waits on its subprocess.
+        
+        Args:
+            pdf_paths: Paths to input PDF files
+            error_list: List to append errors to
+            out_dir: Output directory
+            quality: PDF quality setting ('/screen', '/ebook', '/printer', '/prepress')
+            max_workers: Maximum number of concurrent Ghostscript processes (defaults to CPU count)
+            
+        Returns:
+            Compressed PDF paths in input order, with None for files that failed
+        """
+        if not pdf_paths:
+            return []
+        max_workers = min(max_workers or os.cpu_count() or 1, len(pdf_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda path: self.compress(path, error_list, out_dir, quality), pdf_paths))
+    
+    def compress_batch(self, pdf_paths: List[str], error_list: Optional[List[str]] = None, out_dir: Optional[str] = None, quality: str = '/screen') -> List[Optional[str]]:
+        """
+        Compress several PDFs with a single Ghostscript process.
+        
+        A small PostScript driver switches /OutputFile and runs each input in
+        turn, so Ghostscript's interpreter start-up is paid once instead of
+        once per file. Any file the batch run doesn't produce is retried on
+        its own with compress().
+        
+        Args:
+            pdf_paths: Paths to input PDF files
+            error_list: List to append errors to
+            out_dir: Output directory
+            quality: PDF quality setting ('/screen', '/ebook', '/printer', '/prepress')
+            
+        Returns:
+            Compressed PDF paths in input order, with None for files that failed
+        """
+        if not pdf_paths:
+            return []
+        if len(pdf_paths) == 1 or not self.gs_path:
+            # Without Ghostscript, pikepdf runs in-process, so there is no start-up cost to amortize
+            return [self.compress(pdf_path, error_list, out_dir, quality) for pdf_path in pdf_paths]
+        
+        output_paths = [self._output_path(path, out_dir) for path in pdf_paths]
+        driver_lines = []
+        permit_args = []
+        for pdf_path, output_path in zip(pdf_paths, output_paths):
+            driver_lines.append(f'<< /OutputFile {_ps_string(output_path)} >> setpagedevice')
+            driver_lines.append(f'{_ps_string(pdf_path)} run')
+            permit_args.append(f'--permit-file-read={pdf_path}')
+            permit_args.append(f'--permit-file-write={output_path}')
+        
+        # Outputs left over from earlier runs must not count as produced by this one
+        previous_mtimes = [_mtime_ns(path) for path in output_paths]
+        driver_fd, driver_path = tempfile.mkstemp(suffix='.ps')
+        done = set()
+        try:
+            with os.fdopen(driver_fd, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(driver_lines) + '\n')
+            
+            subprocess.run([
+                self.gs_path,
+                '-sDEVICE=pdfwrite',
+                '-dCompatibilityLevel=1.4',
+                f'-dPDFSETTINGS={quality}',
+                '-dNOPAUSE',
+                '-dQUIET',
+                '-dBATCH',
+                f'-sOutputFile={output_paths[0]}',
+                *permit_args,
+                '-f', driver_path
+            ], check=True, capture_output=True, text=True, close_fds=False)
+            
+            done = {i for i, path in enumerate(output_paths)
+                    if _mtime_ns(path) not in (None, previous_mtimes[i]) and os.path.getsize(path) > 0}
+        except Exception as e:
+            print(f"Batch Ghostscript run failed, compressing PDFs one by one: {e}")
+        finally:
+            os.remove(driver_path)
+        
+        return [output_paths[i] if i in done else self.compress(pdf_path, error_list, out_dir, quality)
+                for i, pdf_path in enumerate(pdf_paths)]
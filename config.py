@@ -12,6 +12,9 @@ class Config:
     APP_NAME = "FileCompressor"
     APP_VERSION = "1.1.5"
     
+    # Enables debug-only UI helpers (e.g. outlined frames)
+    DEBUG = False
+    
     # Default settings
     DEFAULT_JPEG_QUALITY = 60
     DEFAULT_PDF_QUALITY = '/screen'
@@ -19,14 +22,29 @@ class Config:
     DEFAULT_SHOW_PROGRESS = True
     DEFAULT_PLAY_SOUND = True
     
+    # oxipng optimization level for PNGs (0-6, higher is slower but smaller)
+    PNG_OPTIMIZE_LEVEL = 2
+    
     # Supported file formats
-    SUPPORTED_IMAGE_FORMATS = ['.png', '.jpg', '.jpeg', '.heic']
-    SUPPORTED_OFFICE_FORMATS = ['.docx', '.xlsx', '.xls', '.pptx', '.ppt']
-    SUPPORTED_PDF_FORMATS = ['.pdf']
+    SUPPORTED_IMAGE_FORMATS = frozenset({'.png', '.jpg', '.jpeg', '.heic'})
+    SUPPORTED_OFFICE_FORMATS = frozenset({'.docx', '.xlsx', '.xls', '.pptx', '.ppt'})
+    SUPPORTED_PDF_FORMATS = frozenset({'.pdf'})
+    
+    # Extension -> file type, so classifying a file is a single dict lookup
+    _EXT_TO_TYPE = {
+        '.png': 'image', '.jpg': 'image', '.jpeg': 'image', '.heic': 'image',
+        '.docx': 'docx',
+        '.xlsx': 'excel', '.xls': 'excel',
+        '.pptx': 'ppt', '.ppt': 'ppt',
+        '.pdf': 'pdf',
+    }
     
     # PDF quality options
     PDF_QUALITY_OPTIONS = ['/screen', '/ebook', '/printer', '/prepress']
     
+    # JPEG quality used for embedded PDF images when compressing with pikepdf
+    PDF_JPEG_QUALITY = {'/screen': 40, '/ebook': 60, '/printer': 80, '/prepress': 90}
+    
     # File size limits (in bytes)
     MAX_FILE_SIZE = 500 * 1024 * 1024  # 500MB
     
@@ -37,40 +55,34 @@ class Config:
     LOG_FILE = os.path.join(os.path.expanduser("~"), "filecompressor.log")
     ERROR_LOG_FILE = os.path.join(os.path.expanduser("~"), "filecompressor_error.log")
     
+    # Performance monitoring instruments 1 in N decorated calls (FC_PROFILE_SAMPLE_RATE overrides)
+    _sample_rate = os.environ.get('FC_PROFILE_SAMPLE_RATE', '')
+    PROFILE_SAMPLE_RATE = max(1, int(_sample_rate)) if _sample_rate.isdigit() else 1
+    
     # GUI settings
     WINDOW_WIDTH = 450
     WINDOW_HEIGHT = 380
     SETTINGS_DIALOG_WIDTH = 400
     SETTINGS_DIALOG_HEIGHT = 500
+    PROGRESS_UPDATE_INTERVAL = 0.05  # Minimum seconds between progress redraws (~20 Hz)
+    SETTINGS_INPUT_DEBOUNCE_MS = 20  # Delay for coalescing quality slider/entry updates
+    EVENT_LOOP_POLL_INTERVAL_MS = 10  # How often Tk runs the asyncio loop while compressing
     
     # Compression settings
     COMPRESSION_SUFFIX = "_compressed"
     
+    # Deflate level for members rewritten when repacking DOCX/XLSX/PPTX archives
+    ZIP_COMPRESS_LEVEL = 1
+    
     @classmethod
     def get_all_supported_extensions(cls) -> List[str]:
         """Get all supported file extensions."""
-        return (cls.SUPPORTED_IMAGE_FORMATS + 
-                cls.SUPPORTED_OFFICE_FORMATS + 
-                cls.SUPPORTED_PDF_FORMATS)
+        return list(cls._EXT_TO_TYPE)
     
     @classmethod
     def get_file_type(cls, file_path: str) -> str:
         """Get file type based on extension."""
-        ext = os.path.splitext(file_path)[1].lower()
-        
-        if ext in cls.SUPPORTED_IMAGE_FORMATS:
-            return 'image'
-        elif ext in cls.SUPPORTED_OFFICE_FORMATS:
-            if ext == '.docx':
-                return 'docx'
-            elif ext in ['.xlsx', '.xls']:
-                return 'excel'
-            elif ext in ['.pptx', '.ppt']:
-                return 'ppt'
-        elif ext in cls.SUPPORTED_PDF_FORMATS:
-            return 'pdf'
-        
-        return 'unknown'
+        return cls._EXT_TO_TYPE.get(os.path.splitext(file_path)[1].lower(), 'unknown')
     
     @classmethod
     def ensure_temp_dir(cls):
@@ -1,16 +1,18 @@
 import os
-import threading
+import sys
+import time
+import asyncio
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinterdnd2 import DND_FILES, TkinterDnD
-from typing import List
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
-from compressors.docx_compressor import DOCXCompressor
-from compressors.pdf_compressor import PDFCompressor
-from compressors.image_compressor import ImageCompressor
-from compressors.office_generic import compress_office_images
-from utils.file_utils import get_supported_extensions, get_output_path, get_file_type, validate_file_path
+from config import Config
+from utils.batch import compress_file, compress_pdf_batch
+from utils.file_utils import get_supported_extensions, get_output_path, get_file_type, stat_file, validate_file_path
 from utils.sound import play_success_sound
 from utils.i18n import i18n
 from utils.settings_manager import settings_manager
@@ -18,26 +20,94 @@ from .settings_dialog import SettingsDialog
 
 logger = logging.getLogger(__name__)
 
+# Title bar flag for each interface language
+_FLAGS = {
+    'en': '🇺🇸',
+    'de': '🇩🇪',
+    'fr': '🇫🇷',
+    'zh': '🇨🇳',
+    'ja': '🇯🇵',
+    'vi': '🇻🇳',
+    'th': '🇹🇭'
+}
+
+# User-facing failure message key for each compressible file type
+_FAILED_TEXT_KEYS = {
+    'docx': "failed_compress_docx",
+    'pdf': "failed_compress_pdf",
+    'image': "failed_compress_image",
+    'excel': "failed_compress_excel",
+    'ppt': "failed_compress_powerpoint",
+}
+
+# Strings resolved once per language change, so hot paths skip i18n lookups
+_CACHED_TEXT_KEYS = (
+    "main_label", "pdf_quality_label", "select_files_button", "select_output_dir_button",
+    "output_dir_label", "output_dir_selected", "progress_idle", "progress_compressing",
+    "overwrite_question", "overwrite_message", "overwrite_many_message",
+    "overwrite_all_button", "overwrite_none_button", "overwrite_ask_button", "failed_write_log", "unsupported_file_type",
+    "error_compressing", "success_message", "error_message", "done_title",
+    "failed_compress_docx", "failed_compress_pdf", "failed_compress_image",
+    "failed_compress_excel", "failed_compress_powerpoint",
+)
+
+def _iter_supported_files(root: str, exts: FrozenSet[str]) -> Iterator[str]:
+    """Yield supported files under root, rejecting entries by name before stat-ing them."""
+    try:
+        # Read the listing up front so deep trees don't hold a directory handle per level
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_supported_files(entry.path, exts)
+            elif os.path.splitext(entry.name)[1].lower() in exts and entry.is_file():
+                yield entry.path
+        except OSError:
+            continue
+
+def _file_size(path: str) -> int:
+    """Get a file's size in bytes, or 0 if it can't be read."""
+    st = stat_file(path)
+    return st.st_size if st is not None else 0
+
+def _classify_files(paths: Iterable[str]) -> List[Tuple[str, Optional[str]]]:
+    """Validate paths picked by the user and pair each valid one with its file type."""
+    classified = []
+    for path in paths:
+        # Validate file path for security
+        if validate_file_path(path):
+            classified.append((path, get_file_type(path)))
+        else:
+            logger.error(f"Invalid or inaccessible file path: {path}")
+    return classified
+
 class CompressorApp:
     """Main GUI application for file compression with internationalization support."""
     
     def __init__(self):
         self.root = TkinterDnD.Tk()
-        self.output_dir = settings_manager.get_output_directory()
+        self._last_progress_ts = 0.0
+        # Compression batches are coroutines on an asyncio loop pumped from Tk's event loop
+        self.loop = asyncio.new_event_loop()
+        self._pumping = False
+        # Batches run one at a time, in the order they were dropped. The lock is
+        # created by the first batch: before Python 3.10 an asyncio.Lock binds to
+        # the loop current at construction, which must be self.loop
+        self._batch_lock = None
+        self._process_pool = None
+        # Jobs submitted to the pool and not finished yet, so closing can cancel them
+        self._pending_futures = set()
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
         
         # Load settings from settings manager
-        self.jpeg_quality = settings_manager.get_jpeg_quality()
-        self.auto_overwrite = settings_manager.get_auto_overwrite()
-        self.show_progress = settings_manager.get_show_progress()
-        self.play_sound_enabled = settings_manager.get_play_sound()
-        
-        # Initialize compressors with loaded settings
-        self.docx_compressor = DOCXCompressor(jpeg_quality=self.jpeg_quality)
-        self.pdf_compressor = PDFCompressor()
-        self.image_compressor = ImageCompressor(jpeg_quality=self.jpeg_quality)
+        settings = self.load_settings()
+        self.output_dir = settings['output_directory']
         
         # Set initial language based on settings or system
-        saved_language = settings_manager.get_language()
+        saved_language = settings['language']
         if saved_language:
             i18n.set_language(saved_language)
         else:
@@ -116,10 +186,13 @@ class CompressorApp:
         """Create the menu bar with language selection."""
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
+        # (menu, entry index, text key) of every translated menu label
+        self._menu_labels = []
         
         # Language menu
         language_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label=i18n.get_text("language_menu"), menu=language_menu)
+        self._menu_labels.append((menubar, menubar.index('end'), "language_menu"))
         
         # Add language options
         for lang_code, lang_name in i18n.get_available_languages().items():
@@ -131,31 +204,37 @@ class CompressorApp:
         # Settings menu
         settings_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label=i18n.get_text("settings_menu"), menu=settings_menu)
+        self._menu_labels.append((menubar, menubar.index('end'), "settings_menu"))
         settings_menu.add_command(label=i18n.get_text("settings_title"), command=self.open_settings)
+        self._menu_labels.append((settings_menu, settings_menu.index('end'), "settings_title"))
         
         # About menu
         about_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label=i18n.get_text("about_menu"), menu=about_menu)
+        self._menu_labels.append((menubar, menubar.index('end'), "about_menu"))
         about_menu.add_command(label="DOCX/PDF Compressor v1.0", command=self.show_about)
     
+    def load_settings(self):
+        """Load the compression settings from a single settings snapshot and return it."""
+        settings = settings_manager.get_all()
+        self.jpeg_quality = settings['jpeg_quality']
+        self.auto_overwrite = settings['auto_overwrite']
+        self.show_progress = settings['show_progress']
+        self.play_sound_enabled = settings['play_sound']
+        return settings
+    
     def open_settings(self):
         """Open the settings dialog."""
         SettingsDialog(self)
     
     def update_settings(self, settings):
-        """Update application settings."""
+        """Update application settings and return whether they were saved."""
         # Save settings to persistent storage first
-        settings_manager.update_settings(settings)
+        saved = settings_manager.update_settings(settings)
         
         # Reload settings from settings manager to ensure consistency
-        self.jpeg_quality = settings_manager.get_jpeg_quality()
-        self.auto_overwrite = settings_manager.get_auto_overwrite()
-        self.show_progress = settings_manager.get_show_progress()
-        self.play_sound_enabled = settings_manager.get_play_sound()
-        
-        # Update compressors with new JPEG quality
-        self.docx_compressor = DOCXCompressor(jpeg_quality=self.jpeg_quality)
-        self.image_compressor = ImageCompressor(jpeg_quality=self.jpeg_quality)
+        self.load_settings()
+        return saved
     
     def change_language(self, language_code):
         """Change the application language."""
@@ -163,45 +242,47 @@ class CompressorApp:
         # Save language setting
         settings_manager.set_setting('language', language_code)
         self.update_ui_texts()
-        self.recreate_menu()
+        self.update_menu_texts()
     
-    def recreate_menu(self):
-        """Recreate the entire menu bar with updated language."""
-        # Remove existing menu
-        self.root.config(menu=None)
-        
-        # Create new menu
-        self.create_menu()
+    def update_menu_texts(self):
+        """Relabel the existing menus in the current language."""
+        for menu, index, text_key in self._menu_labels:
+            menu.entryconfigure(index, label=i18n.get_text(text_key))
+    
+    def cache_texts(self):
+        """Resolve the current language's strings and templates once."""
+        self._tr = {key: i18n.get_text(key) for key in _CACHED_TEXT_KEYS}
+    
+    def tr(self, key, **kwargs):
+        """Get translated text for a given key from the cache, formatting any placeholders."""
+        text = self._tr.get(key)
+        if text is None:
+            return i18n.get_text(key, **kwargs)
+        if not kwargs:
+            return text
+        try:
+            # format_map reads kwargs directly instead of copying it into a new dict
+            return text.format_map(kwargs)
+        except (KeyError, IndexError, ValueError):
+            return key
     
     def update_ui_texts(self):
         """Update all UI text elements with current language."""
+        self.cache_texts()
         # Get flag emoji based on current language
-        flag_emoji = self.get_flag_emoji()
+        flag_emoji = _FLAGS.get(i18n.current_language, '🇺🇸')
         self.root.title(f"{flag_emoji} File Compressor by LD✨")
-        self.main_label.config(text=i18n.get_text("main_label"))
-        self.pdf_quality_label.config(text=i18n.get_text("pdf_quality_label"))
-        self.select_files_button.config(text=i18n.get_text("select_files_button"))
-        self.output_dir_button.config(text=i18n.get_text("select_output_dir_button"))
+        self.main_label.config(text=self.tr("main_label"))
+        self.pdf_quality_label.config(text=self.tr("pdf_quality_label"))
+        self.select_files_button.config(text=self.tr("select_files_button"))
+        self.output_dir_button.config(text=self.tr("select_output_dir_button"))
         
         if self.output_dir:
-            self.output_dir_label.config(text=i18n.get_text("output_dir_selected", directory=self.output_dir))
+            self.output_dir_label.config(text=self.tr("output_dir_selected", directory=self.output_dir))
         else:
-            self.output_dir_label.config(text=i18n.get_text("output_dir_label"))
+            self.output_dir_label.config(text=self.tr("output_dir_label"))
         
-        self.progress_label.config(text=i18n.get_text("progress_idle"))
-    
-    def get_flag_emoji(self):
-        """Get flag emoji based on current language."""
-        flag_map = {
-            'en': '🇺🇸',
-            'de': '🇩🇪', 
-            'fr': '🇫🇷',
-            'zh': '🇨🇳',
-            'ja': '🇯🇵',
-            'vi': '🇻🇳',
-            'th': '🇹🇭'
-        }
-        return flag_map.get(i18n.current_language, '🇺🇸')
+        self.progress_label.config(text=self.tr("progress_idle"))
     
     def show_about(self):
         """Show about dialog."""
@@ -232,11 +313,11 @@ class CompressorApp:
             self.output_dir = dir_selected
             # Save output directory setting
             settings_manager.set_setting('output_directory', dir_selected)
-            self.output_dir_label.config(text=i18n.get_text("output_dir_selected", directory=self.output_dir))
+            self.output_dir_label.config(text=self.tr("output_dir_selected", directory=self.output_dir))
         else:
             self.output_dir = None
             settings_manager.set_setting('output_directory', None)
-            self.output_dir_label.config(text=i18n.get_text("output_dir_label"))
+            self.output_dir_label.config(text=self.tr("output_dir_label"))
     
     def select_files(self):
         """Open file dialog to select files for compression."""
@@ -249,24 +330,21 @@ class CompressorApp:
             (i18n.get_text("powerpoint_files"), i18n.get_text("powerpoint_types"))
         ])
         if files:
-            self.compress_files(files)
+            self.compress_files(_classify_files(files))
     
     def handle_drop(self, event):
         """Handle file drop events."""
-        exts = tuple(get_supported_extensions())
+        exts = frozenset(get_supported_extensions())
+        # splitlist already undoes Tcl's {...} quoting of paths with spaces
         files = self.root.tk.splitlist(event.data)
-        files = [f.strip('{}') for f in files]
         all_files = []
         
         for f in files:
             if os.path.isdir(f):
-                # Recursively add all supported files in the folder
-                for dirpath, _, filenames in os.walk(f):
-                    for name in filenames:
-                        if name.lower().endswith(exts):
-                            all_files.append(os.path.join(dirpath, name))
-            elif f.lower().endswith(exts):
-                all_files.append(f)
+                # Recursively add all supported files in the folder; scandir already saw they are files
+                all_files.extend((path, get_file_type(path)) for path in _iter_supported_files(f, exts))
+            elif os.path.splitext(f)[1].lower() in exts:
+                all_files.extend(_classify_files([f]))
         
         if all_files:
             self.compress_files(all_files)
@@ -277,159 +355,266 @@ class CompressorApp:
             )
     
     def update_progress(self, current, total):
-        """Update progress bar and label."""
-        def do_update():
-            if total > 0 and self.show_progress:
-                percent = (current / total) * 100
-                self.progress_var.set(percent)
-                self.progress_label.config(text=i18n.get_text("progress_compressing", current=current, total=total))
-                self.root.update_idletasks()
-            else:
-                self.progress_var.set(0)
-                self.progress_label.config(text=i18n.get_text("progress_idle"))
-                self.root.update_idletasks()
-        # Always schedule UI updates on the main thread
-        self.root.after(0, do_update)
+        """Update progress bar and label, rate-limited to Config.PROGRESS_UPDATE_INTERVAL."""
+        now = time.monotonic()
+        # Always show the final and idle states; intermediate ticks are rate-limited
+        if 0 < current < total and now - self._last_progress_ts < Config.PROGRESS_UPDATE_INTERVAL:
+            return
+        self._last_progress_ts = now
+        
+        # Called on the main thread; Tk's idle loop redraws the widgets
+        if total > 0 and self.show_progress:
+            percent = (current / total) * 100
+            self.progress_var.set(percent)
+            self.progress_label.config(text=self.tr("progress_compressing", current=current, total=total))
+        else:
+            self.progress_var.set(0)
+            self.progress_label.config(text=self.tr("progress_idle"))
     
-    def compress_files(self, files: List[str]):
-        """Compress multiple files in a separate thread."""
-        def compress_worker():
-            success = 0
-            errors = []
-            total = len(files)
-            error_log_path = os.path.join(os.getcwd(), 'error_log.txt')
-            
-            def log_error(msg):
-                logger.error(msg)
-                errors.append(msg)
+    def ask_overwrite_policy(self, message: str) -> str:
+        """
+        Ask how to treat a batch of existing output files.
+        
+        Returns:
+            'yes' to overwrite all, 'no' to skip all, or 'ask' to decide per file
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title(self.tr("overwrite_question"))
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        # Closing the dialog skips the existing files, like answering "No"
+        policy = tk.StringVar(dialog, value='no')
+        
+        tk.Label(dialog, text=message, justify='left', wraplength=400, padx=10, pady=10).pack()
+        buttons = tk.Frame(dialog)
+        buttons.pack(pady=(0, 10))
+        for text_key, value in (
+            ("overwrite_all_button", 'yes'),
+            ("overwrite_none_button", 'no'),
+            ("overwrite_ask_button", 'ask'),
+        ):
+            tk.Button(
+                buttons,
+                text=self.tr(text_key),
+                command=lambda value=value: (policy.set(value), dialog.destroy()),
+                padx=10
+            ).pack(side='left', padx=5)
+        
+        dialog.grab_set()
+        self.root.wait_window(dialog)
+        return policy.get()
+    
+    def confirm_overwrite(self, output_paths: List[str]) -> Set[str]:
+        """Ask which existing output files may be overwritten, with a single dialog in the common case."""
+        question = self.tr("overwrite_question")
+        if len(output_paths) == 1:
+            policy = 'ask'
+        else:
+            # Keep the dialog a sensible size for large drops
+            max_files_to_show = 10
+            names = [os.path.basename(path) for path in output_paths[:max_files_to_show]]
+            if len(output_paths) > max_files_to_show:
+                names.append("...")
+            policy = self.ask_overwrite_policy(
+                self.tr("overwrite_many_message", count=len(output_paths), files='\n'.join(names))
+            )
+        
+        if policy == 'yes':
+            return set(output_paths)
+        if policy == 'no':
+            return set()
+        return {
+            path for path in output_paths
+            if messagebox.askyesno(question, self.tr("overwrite_message", file_path=path))
+        }
+    
+    def compress_files(self, files: List[Tuple[str, Optional[str]]]):
+        """
+        Compress multiple files in worker processes, without blocking the UI.
+        
+        Args:
+            files: (path, file type) pairs of validated files, as built by handle_drop/select_files
+        """
+        errors = []
+        total = len(files)
+        error_log_path = os.path.join(os.getcwd(), 'error_log.txt')
+        
+        # Messages for error_log.txt, written in one go when the batch finishes
+        log_lines = []
+        
+        def log_error(msg):
+            logger.error(msg)
+            errors.append(msg)
+            log_lines.append(msg + '\n')
+        
+        def flush_error_log():
+            if not log_lines:
+                return
+            try:
+                with open(error_log_path, 'a', encoding='utf-8') as f:
+                    f.writelines(log_lines)
+            except Exception as log_e:
+                logger.error(self.tr("failed_write_log", error=str(log_e)))
+        
+        # One listing per output folder instead of a stat per file
+        listings = {}
+        
+        def output_exists(path):
+            folder = os.path.dirname(path)
+            if folder not in listings:
                 try:
-                    with open(error_log_path, 'a', encoding='utf-8') as f:
-                        f.write(msg + '\n')
-                except Exception as log_e:
-                    logger.error(i18n.get_text("failed_write_log", error=str(log_e)))
+                    with os.scandir(folder or '.') as it:
+                        listings[folder] = {entry.name for entry in it}
+                except OSError:
+                    listings[folder] = set()
+            return os.path.basename(path) in listings[folder]
+        
+        # Validate files and settle overwrites up front, so the worker never waits on a dialog
+        jobs = []
+        existing = []
+        for file_path, ftype in files:
+            if ftype not in _FAILED_TEXT_KEYS:
+                log_error(self.tr("unsupported_file_type", path=file_path))
+                continue
             
-            for idx, file_path in enumerate(files, 1):
-                self.update_progress(idx, total)
-                
-                # Validate file path for security
-                if not validate_file_path(file_path):
-                    log_error(f"Invalid or inaccessible file path: {file_path}")
-                    continue
-                
-                ftype = get_file_type(file_path)
-                try:
-                    if ftype == 'docx':
-                        output_path = get_output_path(file_path, self.output_dir, '_compressed')
-                        if os.path.exists(output_path) and not self.auto_overwrite:
-                            overwrite = messagebox.askyesno(
-                                i18n.get_text("overwrite_question"), 
-                                i18n.get_text("overwrite_message", file_path=output_path)
-                            )
-                            if not overwrite:
-                                continue
-                        compressed_path = self.docx_compressor.compress(
-                            file_path, 
-                            error_list=errors, 
-                            out_dir=self.output_dir
-                        )
-                        if compressed_path:
-                            logger.info(i18n.get_text("compressed_docx", path=compressed_path))
-                            success += 1
-                        else:
-                            log_error(i18n.get_text("failed_compress_docx", path=file_path))
-                    elif ftype == 'pdf':
-                        output_path = get_output_path(file_path, self.output_dir, '_compressed')
-                        if os.path.exists(output_path) and not self.auto_overwrite:
-                            overwrite = messagebox.askyesno(
-                                i18n.get_text("overwrite_question"), 
-                                i18n.get_text("overwrite_message", file_path=output_path)
-                            )
-                            if not overwrite:
-                                continue
-                        compressed_pdf = self.pdf_compressor.compress(
-                            file_path, 
-                            error_list=errors, 
-                            out_dir=self.output_dir, 
-                            quality=self.pdf_quality_var.get()
-                        )
-                        if compressed_pdf:
-                            logger.info(i18n.get_text("compressed_pdf", path=compressed_pdf))
-                            success += 1
-                        else:
-                            log_error(i18n.get_text("failed_compress_pdf", path=file_path))
-                    elif ftype == 'image':
-                        output_path = get_output_path(file_path, self.output_dir, '_compressed')
-                        if os.path.exists(output_path) and not self.auto_overwrite:
-                            overwrite = messagebox.askyesno(
-                                i18n.get_text("overwrite_question"), 
-                                i18n.get_text("overwrite_message", file_path=output_path)
-                            )
-                            if not overwrite:
-                                continue
-                        compressed_img = self.image_compressor.compress(
-                            file_path, 
-                            error_list=errors, 
-                            out_dir=self.output_dir
-                        )
-                        if compressed_img:
-                            logger.info(i18n.get_text("compressed_image", path=compressed_img))
-                            success += 1
-                        else:
-                            log_error(i18n.get_text("failed_compress_image", path=file_path))
-                    elif ftype == 'excel':
-                        output_path = get_output_path(file_path, self.output_dir, '_compressed')
-                        if os.path.exists(output_path) and not self.auto_overwrite:
-                            overwrite = messagebox.askyesno(
-                                i18n.get_text("overwrite_question"), 
-                                i18n.get_text("overwrite_message", file_path=output_path)
-                            )
-                            if not overwrite:
-                                continue
-                        compressed = compress_office_images(file_path, "xl/media", quality=self.jpeg_quality)
-                        if compressed:
-                            logger.info(i18n.get_text("compressed_excel", path=compressed))
-                            success += 1
-                        else:
-                            log_error(i18n.get_text("failed_compress_excel", path=file_path))
-                    elif ftype == 'ppt':
-                        output_path = get_output_path(file_path, self.output_dir, '_compressed')
-                        if os.path.exists(output_path) and not self.auto_overwrite:
-                            overwrite = messagebox.askyesno(
-                                i18n.get_text("overwrite_question"), 
-                                i18n.get_text("overwrite_message", file_path=output_path)
-                            )
-                            if not overwrite:
-                                continue
-                        compressed = compress_office_images(file_path, "ppt/media", quality=self.jpeg_quality)
-                        if compressed:
-                            logger.info(i18n.get_text("compressed_powerpoint", path=compressed))
+            output_path = get_output_path(file_path, self.output_dir, '_compressed')
+            exists = not self.auto_overwrite and output_exists(output_path)
+            if exists:
+                existing.append(output_path)
+            jobs.append((file_path, ftype, output_path if exists else None))
+        
+        overwrite = self.confirm_overwrite(existing) if existing else set()
+        jobs = [(file_path, ftype) for file_path, ftype, existing_path in jobs
+                if existing_path is None or existing_path in overwrite]
+        # Run each file type together, smallest files first so progress moves early
+        jobs.sort(key=lambda job: (job[1], _file_size(job[0])))
+        
+        # Each job resolves to a list of (path, type, output path, compressor errors, exception)
+        async def compress_one(file_path, ftype):
+            try:
+                ftype, output_path, file_errors = await self._submit(
+                    compress_file, file_path, self.output_dir, self.jpeg_quality, pdf_quality, ftype
+                )
+            except Exception as e:
+                return [(file_path, ftype, None, [], e)]
+            return [(file_path, ftype, output_path, file_errors, None)]
+        
+        async def compress_pdf_group(pdf_paths):
+            try:
+                output_paths, group_errors = await self._submit(
+                    compress_pdf_batch, pdf_paths, self.output_dir, pdf_quality
+                )
+            except Exception as e:
+                return [(file_path, 'pdf', None, [], e) for file_path in pdf_paths]
+            # The group shares one error list; report it once, with the first file
+            return [
+                (file_path, 'pdf', output_path, group_errors if i == 0 else [], None)
+                for i, (file_path, output_path) in enumerate(zip(pdf_paths, output_paths))
+            ]
+        
+        def schedule_jobs():
+            pdf_paths = [file_path for file_path, ftype in jobs if ftype == 'pdf']
+            # One Ghostscript run per worker process instead of one per PDF;
+            # striding the size-sorted list keeps the groups balanced
+            groups = min(os.cpu_count() or 1, len(pdf_paths))
+            scheduled = [compress_pdf_group(pdf_paths[i::groups]) for i in range(groups)]
+            scheduled.extend(compress_one(file_path, ftype) for file_path, ftype in jobs if ftype != 'pdf')
+            return scheduled
+        
+        async def compress_batch():
+            if self._batch_lock is None:
+                self._batch_lock = asyncio.Lock()
+            async with self._batch_lock:
+                success = 0
+                # Skipped files count towards progress straight away
+                done = total - len(jobs)
+                self.update_progress(done, total)
+                for next_done in asyncio.as_completed(schedule_jobs()):
+                    for file_path, ftype, output_path, file_errors, error in await next_done:
+                        done += 1
+                        self.update_progress(done, total)
+                        if error is not None:
+                            log_error(self.tr("error_compressing", path=file_path, error=str(error)))
+                            continue
+                        errors.extend(file_errors)
+                        if output_path:
+                            # Log lines stay in English and are only formatted if INFO is enabled
+                            logger.info("Compressed %s: %s", ftype, output_path)
                             success += 1
                         else:
-                            log_error(i18n.get_text("failed_compress_powerpoint", path=file_path))
-                    else:
-                        msg = i18n.get_text("unsupported_file_type", path=file_path)
-                        log_error(msg)
-                except Exception as e:
-                    msg = i18n.get_text("error_compressing", path=file_path, error=str(e))
-                    log_error(msg)
-            self.update_progress(0, 0)
-            if self.play_sound_enabled:
-                play_success_sound()
-            msg = i18n.get_text("success_message", count=success)
-            if errors:
-                # Limit the number of errors shown to prevent overwhelming the user
-                max_errors_to_show = 10
-                if len(errors) > max_errors_to_show:
-                    shown_errors = errors[:max_errors_to_show]
+                            log_error(self.tr(_FAILED_TEXT_KEYS[ftype], path=file_path))
+                flush_error_log()
+                self.update_progress(0, 0)
+                if self.play_sound_enabled:
+                    play_success_sound()
+                msg = self.tr("success_message", count=success)
+                if errors:
+                    # Limit the number of errors shown to prevent overwhelming the user;
+                    # only the shown slice is ever joined
+                    max_errors_to_show = 10
+                    shown_errors = '\n'.join(errors[:max_errors_to_show])
+                    msg += "\n\n" + self.tr('error_message', errors=shown_errors)
                     remaining_count = len(errors) - max_errors_to_show
-                    msg += f"\n\n{i18n.get_text('error_message', errors='\n'.join(shown_errors))}"
-                    msg += f"\n\n... and {remaining_count} more errors. Check error_log.txt for full details."
-                else:
-                    msg += f"\n\n{i18n.get_text('error_message', errors='\n'.join(errors))}"
-            # Show messagebox on the main thread
-            self.root.after(0, lambda: messagebox.showinfo(i18n.get_text("done_title"), msg))
-        
-        threading.Thread(target=compress_worker).start()
+                    if remaining_count > 0:
+                        msg += f"\n\n... and {remaining_count} more errors. Check error_log.txt for full details."
+                # Show the messagebox from Tk's loop: its modal loop must not run inside an asyncio step
+                self.root.after(0, lambda: messagebox.showinfo(self.tr("done_title"), msg))
+        
+        pdf_quality = self.pdf_quality_var.get()
+        # Start the workers now so they spawn while the batch is being scheduled
+        self._get_process_pool()
+        self.loop.create_task(compress_batch()).add_done_callback(self._log_worker_failure)
+        if not self._pumping:
+            self._pumping = True
+            self._pump_loop()
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the worker process pool, starting it on first use and keeping it warm between batches."""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._process_pool
+    
+    def _submit(self, fn, *args) -> asyncio.Future:
+        """Run fn(*args) in the worker pool, tracking it so on_close can cancel it."""
+        future = self._get_process_pool().submit(fn, *args)
+        self._pending_futures.add(future)
+        # Done callbacks run on the pool's thread; hand the discard to the loop so
+        # the set is only touched from the Tk thread, where on_close iterates it
+        future.add_done_callback(
+            lambda f: self.loop.call_soon_threadsafe(self._pending_futures.discard, f))
+        return asyncio.wrap_future(future, loop=self.loop)
+    
+    def _pump_loop(self):
+        """Run the asyncio loop's ready callbacks, rescheduling while batches are pending."""
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        if asyncio.all_tasks(self.loop):
+            self.root.after(Config.EVENT_LOOP_POLL_INTERVAL_MS, self._pump_loop)
+        else:
+            # Stop polling while idle; compress_files restarts it
+            self._pumping = False
+    
+    def _log_worker_failure(self, task):
+        """Log a compression batch that died with an exception (the loop otherwise swallows it)."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Compression batch failed", exc_info=task.exception())
+    
+    def on_close(self):
+        """Cancel pending batches, stop the worker processes and close the main window."""
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+        # Cancel queued jobs explicitly (shutdown's cancel_futures needs Python 3.9)
+        for future in list(self._pending_futures):
+            future.cancel()
+        if self._process_pool is not None:
+            # Python 3.8's shutdown(wait=False) can hang interpreter exit while
+            # jobs are still running, so wait for those to finish there
+            self._process_pool.shutdown(wait=sys.version_info < (3, 9))
+        settings_manager.flush()
+        self.root.destroy()
     
     def run(self):
         """Start the GUI application."""
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+from config import Config
 from utils.i18n import i18n
 from utils.settings_manager import settings_manager
 import os
@@ -8,17 +9,49 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# The debug style only needs registering with Tk once per process
+_DEBUG_STYLE_INSTALLED = False
+
 def _add_debug_style():
     # Add a red border style for debugging
+    global _DEBUG_STYLE_INSTALLED
+    if _DEBUG_STYLE_INSTALLED or not getattr(Config, 'DEBUG', False):
+        return
     style = ttk.Style()
     style.configure('Red.TFrame', borderwidth=2, relief='solid', background='#ffcccc')
+    _DEBUG_STYLE_INSTALLED = True
 
 class SettingsDialog:
     """Settings dialog for the application."""
     
+    # Plain labels, and button labels with their emoji prefix
+    _LABEL_KEYS = (
+        "settings_title", "jpeg_quality_setting", "jpeg_quality_description",
+        "auto_overwrite_setting", "auto_overwrite_description",
+        "show_progress_setting", "show_progress_description",
+        "play_sound_setting", "play_sound_description",
+    )
+    _BUTTON_LABELS = (
+        ("reset_defaults_button", "♻️ "),
+        ("cancel_button", "❌ "),
+        ("save_button", "💾 "),
+    )
+    # Resolved labels per language, built on the first dialog opened in that language
+    _LABEL_CACHE = {}
+    
+    @classmethod
+    def _get_labels(cls):
+        """Get the dialog's labels in the current language."""
+        labels = cls._LABEL_CACHE.get(i18n.current_language)
+        if labels is None:
+            labels = {key: i18n.get_text(key) for key in cls._LABEL_KEYS}
+            labels.update((key, prefix + i18n.get_text(key)) for key, prefix in cls._BUTTON_LABELS)
+            cls._LABEL_CACHE[i18n.current_language] = labels
+        return labels
+    
     def __init__(self, parent):
         self.parent = parent
-        _add_debug_style()  # <-- moved here
+        _add_debug_style()
         self.dialog = tk.Toplevel(parent.root)
         self.dialog.geometry("500x650")  # Default initial width 500px
         self.dialog.resizable(True, True)
@@ -32,11 +65,21 @@ class SettingsDialog:
         self.dialog.geometry(f"500x650+{x}+{y}")
         
         # Settings variables - load from settings manager
+        # The quality entry displays this variable directly; the slider is not bound
+        # to it, so a drag only updates it once per debounce interval
         self.jpeg_quality_var = tk.IntVar(value=settings_manager.get_jpeg_quality())
+        self._last_valid_quality = self.jpeg_quality_var.get()
         self.auto_overwrite_var = tk.BooleanVar(value=settings_manager.get_auto_overwrite())
         self.show_progress_var = tk.BooleanVar(value=settings_manager.get_show_progress())
         self.play_sound_var = tk.BooleanVar(value=settings_manager.get_play_sound())
         
+        # after() tokens for debounced slider/entry updates
+        self._pending_scale = None
+        self._pending_scale_value = None
+        self._pending_entry = None
+        # Set while reset_to_defaults updates the traced variables
+        self._suppress_trace = False
+        
         self.setup_ui()
         
         # Dynamically resize to fit all widgets after layout
@@ -57,20 +100,21 @@ class SettingsDialog:
     
     def setup_ui(self):
         """Setup the user interface."""
+        labels = self._get_labels()
         # Main frame
         main_frame = ttk.Frame(self.dialog, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # Title
-        title_label = ttk.Label(main_frame, text=i18n.get_text("settings_title"), 
+        title_label = ttk.Label(main_frame, text=labels["settings_title"], 
                                font=("Arial", 16, "bold"))
         title_label.pack(pady=(0, 20))
         
         # JPEG Quality Setting
-        jpeg_frame = ttk.LabelFrame(main_frame, text=i18n.get_text("jpeg_quality_setting"), padding="10")
+        jpeg_frame = ttk.LabelFrame(main_frame, text=labels["jpeg_quality_setting"], padding="10")
         jpeg_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(jpeg_frame, text=i18n.get_text("jpeg_quality_description")).pack(anchor=tk.W)
+        ttk.Label(jpeg_frame, text=labels["jpeg_quality_description"]).pack(anchor=tk.W)
         
         # Quality control frame
         quality_frame = ttk.Frame(jpeg_frame)
@@ -78,7 +122,7 @@ class SettingsDialog:
         
         # Slider
         self.quality_scale = ttk.Scale(quality_frame, from_=1, to=100, 
-                                      variable=self.jpeg_quality_var, orient=tk.HORIZONTAL)
+                                      value=self.jpeg_quality_var.get(), orient=tk.HORIZONTAL)
         self.quality_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         
         # Input box for exact value
@@ -94,32 +138,29 @@ class SettingsDialog:
         self.quality_entry.bind('<FocusOut>', self.validate_quality_entry)
         
         # Bind auto-save events for checkboxes
-        self._auto_overwrite_trace = self.auto_overwrite_var.trace_add('write', self.on_setting_changed)
-        self._show_progress_trace = self.show_progress_var.trace_add('write', self.on_setting_changed)
-        self._play_sound_trace = self.play_sound_var.trace_add('write', self.on_setting_changed)
-        
-        # Set initial value
-        self.update_quality_display()
+        self.auto_overwrite_var.trace_add('write', self.on_setting_changed)
+        self.show_progress_var.trace_add('write', self.on_setting_changed)
+        self.play_sound_var.trace_add('write', self.on_setting_changed)
         
         # Auto Overwrite Setting
-        overwrite_frame = ttk.LabelFrame(main_frame, text=i18n.get_text("auto_overwrite_setting"), padding="10")
+        overwrite_frame = ttk.LabelFrame(main_frame, text=labels["auto_overwrite_setting"], padding="10")
         overwrite_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(overwrite_frame, text=i18n.get_text("auto_overwrite_description")).pack(anchor=tk.W)
+        ttk.Label(overwrite_frame, text=labels["auto_overwrite_description"]).pack(anchor=tk.W)
         ttk.Checkbutton(overwrite_frame, variable=self.auto_overwrite_var).pack(anchor=tk.W, pady=(5, 0))
         
         # Show Progress Setting
-        progress_frame = ttk.LabelFrame(main_frame, text=i18n.get_text("show_progress_setting"), padding="10")
+        progress_frame = ttk.LabelFrame(main_frame, text=labels["show_progress_setting"], padding="10")
         progress_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(progress_frame, text=i18n.get_text("show_progress_description")).pack(anchor=tk.W)
+        ttk.Label(progress_frame, text=labels["show_progress_description"]).pack(anchor=tk.W)
         ttk.Checkbutton(progress_frame, variable=self.show_progress_var).pack(anchor=tk.W, pady=(5, 0))
         
         # Play Sound Setting
-        sound_frame = ttk.LabelFrame(main_frame, text=i18n.get_text("play_sound_setting"), padding="10")
+        sound_frame = ttk.LabelFrame(main_frame, text=labels["play_sound_setting"], padding="10")
         sound_frame.pack(fill=tk.X, pady=(0, 20))
         
-        ttk.Label(sound_frame, text=i18n.get_text("play_sound_description")).pack(anchor=tk.W)
+        ttk.Label(sound_frame, text=labels["play_sound_description"]).pack(anchor=tk.W)
         ttk.Checkbutton(sound_frame, variable=self.play_sound_var).pack(anchor=tk.W, pady=(5, 0))
         
         # Status label for save feedback
@@ -131,35 +172,59 @@ class SettingsDialog:
         button_frame.pack(fill=tk.X, pady=(20, 0), anchor='e')
         
         # Reset to Defaults (♻️) - left side
-        reset_button = ttk.Button(button_frame, text="♻️ " + i18n.get_text("reset_defaults_button"), command=self.reset_to_defaults)
+        reset_button = ttk.Button(button_frame, text=labels["reset_defaults_button"], command=self.reset_to_defaults)
         reset_button.pack(side=tk.LEFT, padx=(0, 10))
         
         # Cancel (❌) - right side
-        cancel_button = ttk.Button(button_frame, text="❌ " + i18n.get_text("cancel_button"), command=self.dialog.destroy)
+        cancel_button = ttk.Button(button_frame, text=labels["cancel_button"], command=self.dialog.destroy)
         cancel_button.pack(side=tk.RIGHT, padx=(5, 0))
         
         # Save (💾) - right side
-        self.save_button = ttk.Button(button_frame, text="💾 " + i18n.get_text("save_button"), command=self.save_and_close)
+        self.save_button = ttk.Button(button_frame, text=labels["save_button"], command=self.save_and_close)
         self.save_button.pack(side=tk.RIGHT, padx=(5, 0))
     
     def update_quality_from_scale(self, value):
-        """Update quality from slider changes."""
+        """Update quality from slider changes, coalescing the motion events of a drag."""
+        self._pending_scale_value = value
+        if self._pending_scale is None:
+            self._pending_scale = self.dialog.after(Config.SETTINGS_INPUT_DEBOUNCE_MS, self._apply_scale)
+    
+    def _apply_scale(self):
+        """Apply the latest slider value."""
+        self._pending_scale = None
+        if not self.dialog.winfo_exists():
+            return
         try:
-            quality = int(float(value))
+            quality = int(float(self._pending_scale_value))
             self.jpeg_quality_var.set(quality)
-            self.update_quality_display()
+            self._last_valid_quality = quality
         except ValueError:
             pass
     
+    def _set_quality(self, quality: int):
+        """Set the quality from the entry box or defaults, moving the unbound slider to match."""
+        self.jpeg_quality_var.set(quality)
+        self._last_valid_quality = quality
+        # configure() doesn't invoke the slider's command, unlike dragging it
+        self.quality_scale.configure(value=quality)
+    
     def update_quality_from_entry(self, event=None):
-        """Update quality from entry box changes."""
+        """Update quality from entry box changes, coalescing bursts of key presses."""
+        if self._pending_entry is None:
+            self._pending_entry = self.dialog.after(Config.SETTINGS_INPUT_DEBOUNCE_MS, self._apply_entry)
+    
+    def _apply_entry(self):
+        """Move the slider to the entry box's value if it is a valid quality (the variable already holds it)."""
+        self._pending_entry = None
+        if not self.dialog.winfo_exists():
+            return
         try:
             value = self.quality_entry.get()
             if value.strip():
                 quality = int(value)
                 if 1 <= quality <= 100:
-                    self.jpeg_quality_var.set(quality)
-                    self.update_quality_display()
+                    self._last_valid_quality = quality
+                    self.quality_scale.configure(value=quality)
         except ValueError:
             pass
     
@@ -173,17 +238,10 @@ class SettingsDialog:
                     quality = 1
                 elif quality > 100:
                     quality = 100
-                self.jpeg_quality_var.set(quality)
-                self.update_quality_display()
+                self._set_quality(quality)
         except ValueError:
-            # If invalid, reset to current variable value
-            self.update_quality_display()
-    
-    def update_quality_display(self):
-        """Update the display of quality value."""
-        quality = self.jpeg_quality_var.get()
-        self.quality_entry.delete(0, tk.END)
-        self.quality_entry.insert(0, str(quality))
+            # If invalid, reset to the last valid value
+            self._set_quality(self._last_valid_quality)
     
     def save_settings(self):
         """Save the current settings."""
@@ -198,14 +256,14 @@ class SettingsDialog:
             
             logger.info(f"Saving settings: {new_settings}")
             
-            # Update settings manager
-            success = settings_manager.update_settings(new_settings)
+            # The parent saves the settings itself, so write through it when possible
+            # to keep this to a single settings.json write
+            if hasattr(self.parent, 'update_settings'):
+                success = self.parent.update_settings(new_settings)
+            else:
+                success = settings_manager.update_settings(new_settings)
             
             if success:
-                # Update parent application settings
-                if hasattr(self.parent, 'update_settings'):
-                    self.parent.update_settings(new_settings)
-                
                 # Show success feedback
                 self.status_label.config(text="✓ Settings saved successfully!", foreground="green")
                 self.save_button.config(state="disabled")  # Temporarily disable save button
@@ -237,26 +295,22 @@ class SettingsDialog:
     
     def on_setting_changed(self, *args):
         """Called when a setting is changed - enables save button."""
+        if self._suppress_trace:
+            return
         self.save_button.config(state="normal")
         self.status_label.config(text="Settings changed - click 'Save Settings' to save", foreground="blue")
     
     def reset_to_defaults(self):
         """Reset all settings to defaults."""
-        # Remove traces to avoid triggering during reset
+        defaults = settings_manager.get_default_settings()
+        # Silence the variable traces while resetting, then report a single change
+        self._suppress_trace = True
         try:
-            self.auto_overwrite_var.trace_remove('write', self._auto_overwrite_trace)
-            self.show_progress_var.trace_remove('write', self._show_progress_trace)
-            self.play_sound_var.trace_remove('write', self._play_sound_trace)
-        except Exception:
-            pass
-        # Reset values
-        self.jpeg_quality_var.set(settings_manager.get_default_settings()['jpeg_quality'])
-        self.auto_overwrite_var.set(settings_manager.get_default_settings()['auto_overwrite'])
-        self.show_progress_var.set(settings_manager.get_default_settings()['show_progress'])
-        self.play_sound_var.set(settings_manager.get_default_settings()['play_sound'])
-        self.update_quality_display()
-        # Re-bind traces
-        self._auto_overwrite_trace = self.auto_overwrite_var.trace_add('write', self.on_setting_changed)
-        self._show_progress_trace = self.show_progress_var.trace_add('write', self.on_setting_changed)
-        self._play_sound_trace = self.play_sound_var.trace_add('write', self.on_setting_changed)
+            self._set_quality(defaults['jpeg_quality'])
+            self.auto_overwrite_var.set(defaults['auto_overwrite'])
+            self.show_progress_var.set(defaults['show_progress'])
+            self.play_sound_var.set(defaults['play_sound'])
+        finally:
+            self._suppress_trace = False
+        self.on_setting_changed()
         self.status_label.config(text=i18n.get_text("settings_saved")) 
\ No newline at end of file
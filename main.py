@@ -9,13 +9,15 @@ import sys
 import os
 import traceback
 import logging
+from datetime import datetime
 from typing import Optional
 
 # Path setup
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from utils.logger import setup_logging
+from utils.logger import setup_logging, stop_logging
 from gui.app_window import CompressorApp
+from utils.settings_manager import settings_manager
 
 DEBUG_LOG_PATH = "/tmp/fc_debug.log"
 CRASH_LOG_PATH = "/tmp/fc_crash_gui.log"
@@ -24,24 +26,30 @@ def write_debug_log():
     """Write basic debug info to temp log."""
     try:
         with open(DEBUG_LOG_PATH, "w") as log:
-            log.write("✅ File Compressor launched from GUI!\n")
-            log.write(f"🧠 Python version: {sys.version}\n")
-            log.write(f"📁 Working dir: {os.getcwd()}\n")
-            log.write(f"📄 __file__: {__file__}\n")
+            log.write(
+                "✅ File Compressor launched from GUI!\n"
+                f"🧠 Python version: {sys.version}\n"
+                f"📁 Working dir: {os.getcwd()}\n"
+                f"📄 __file__: {__file__}\n"
+            )
     except Exception as e:
         # If we can't even write to /tmp, then this is truly cursed
         print(f"❌ Failed to write debug log: {e}")
 
-def write_crash_log(e: Exception):
-    """Write crash traceback to temp file for GUI debugging."""
+def write_crash_log(e: Exception, tb: str):
+    """Write the crash traceback to the temp file for GUI debugging and to the persistent crash log."""
     try:
         with open(CRASH_LOG_PATH, "w") as f:
-            f.write("💥 App crashed!\n")
-            f.write(f"Error: {e}\n")
-            f.write("Traceback:\n")
-            f.write(traceback.format_exc())
+            f.write(f"💥 App crashed!\nError: {e}\nTraceback:\n{tb}")
     except Exception as log_e:
         print(f"❌ Failed to write crash log: {log_e}")
+    
+    try:
+        crash_log_path = os.path.join(os.path.expanduser("~"), "filecompressor_crash.log")
+        with open(crash_log_path, "a", encoding="utf-8") as f:
+            f.write(f"\n{'=' * 60}\nCrash at: {datetime.now()}\nError: {e}\n{tb}")
+    except Exception as log_e:
+        print(f"Failed to write persistent crash log: {log_e}")
 
 def main() -> None:
     """Main launcher for the File Compressor app."""
@@ -62,25 +70,22 @@ def main() -> None:
         print("⚠️ Application interrupted by user")
     except Exception as e:
         print(f"❌ Fatal error starting application: {e}")
-        traceback.print_exc()
+        # Format the traceback once for the console and both crash logs
+        tb = traceback.format_exc()
+        print(tb, end="", file=sys.stderr)
 
         # Write crash info to file
-        write_crash_log(e)
-
-        # Also write to main crash log file
-        try:
-            crash_log_path = os.path.join(os.path.expanduser("~"), "filecompressor_crash.log")
-            with open(crash_log_path, "a", encoding="utf-8") as f:
-                f.write("\n" + "=" * 60 + "\n")
-                f.write(f"Crash at: {__import__('datetime').datetime.now()}\n")
-                f.write(f"Error: {e}\n")
-                traceback.print_exc(file=f)
-        except Exception as log_e:
-            print(f"Failed to write persistent crash log: {log_e}")
+        write_crash_log(e, tb)
         
         sys.exit(1)
+    finally:
+        # Save deferred setting changes while their errors can still be logged
+        settings_manager.flush()
+        # Write out any log records still queued for the background listener
+        stop_logging()
 
 if __name__ == "__main__":
     import multiprocessing
+    multiprocessing.freeze_support()  # Worker processes in frozen builds must not relaunch the GUI
     multiprocessing.set_start_method('spawn')  # Ensures compatibility on macOS
     main()
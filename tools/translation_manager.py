@@ -5,24 +5,28 @@ Translation Manager Tool
 A utility to help manage and update translations for the DOCX/PDF Compressor application.
 """
 
-import json
 import os
 import sys
 
+# Run from tools/; make the application's packages importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import jsonio
+
 def load_translations(lang_code):
     """Load translations for a specific language."""
     translation_file = f"../locales/{lang_code}/translations.json"
     if os.path.exists(translation_file):
-        with open(translation_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(translation_file, 'rb') as f:
+            return jsonio.loads(f.read())
     return {}
 
 def save_translations(lang_code, translations):
     """Save translations for a specific language."""
     translation_file = f"../locales/{lang_code}/translations.json"
     os.makedirs(os.path.dirname(translation_file), exist_ok=True)
-    with open(translation_file, 'w', encoding='utf-8') as f:
-        json.dump(translations, f, ensure_ascii=False, indent=2)
+    with open(translation_file, 'wb') as f:
+        f.write(jsonio.dumps(translations))
 
 def get_missing_keys(base_translations, target_translations):
     """Get keys that are missing from target translations."""
@@ -0,0 +1,81 @@
+"""
+Batch compression helpers for the File Compressor application.
+"""
+
+from typing import List, Optional, Tuple
+from utils.file_utils import get_file_type
+
+# Compressor modules are imported on first use, so the GUI and workers only
+# load the libraries (Pillow, numpy, pikepdf...) for the file types they handle
+def _compress_docx(path, out_dir, jpeg_quality, pdf_quality, errors):
+    from compressors.docx_compressor import DOCXCompressor
+    return DOCXCompressor(jpeg_quality=jpeg_quality).compress(path, error_list=errors, out_dir=out_dir)
+
+def _compress_pdf(path, out_dir, jpeg_quality, pdf_quality, errors):
+    from compressors.pdf_compressor import PDFCompressor
+    return PDFCompressor().compress(path, error_list=errors, out_dir=out_dir, quality=pdf_quality)
+
+def _compress_image(path, out_dir, jpeg_quality, pdf_quality, errors):
+    from compressors.image_compressor import ImageCompressor
+    return ImageCompressor(jpeg_quality=jpeg_quality).compress(path, error_list=errors, out_dir=out_dir)
+
+def _compress_excel(path, out_dir, jpeg_quality, pdf_quality, errors):
+    from compressors.office_generic import compress_office_images
+    return compress_office_images(path, "xl/media", quality=jpeg_quality)
+
+def _compress_ppt(path, out_dir, jpeg_quality, pdf_quality, errors):
+    from compressors.office_generic import compress_office_images
+    return compress_office_images(path, "ppt/media", quality=jpeg_quality)
+
+# File type -> compressor taking (path, out_dir, jpeg_quality, pdf_quality, error_list)
+_FILE_COMPRESSORS = {
+    'docx': _compress_docx,
+    'pdf': _compress_pdf,
+    'image': _compress_image,
+    'excel': _compress_excel,
+    'ppt': _compress_ppt,
+}
+
+def compress_file(file_path: str, out_dir: Optional[str], jpeg_quality: int,
+                  pdf_quality: str, ftype: Optional[str] = None) -> Tuple[str, Optional[str], List[str]]:
+    """
+    Compress a single file with the compressor for its type.
+
+    Runs inside a worker process, so it must stay a module-level function
+    taking only picklable arguments.
+
+    Args:
+        file_path: Input file path
+        out_dir: Output directory (None to write next to the input)
+        jpeg_quality: JPEG quality setting (1-100)
+        pdf_quality: Ghostscript PDF quality preset (e.g. '/screen')
+        ftype: File type if the caller already classified the file (see get_file_type)
+
+    Returns:
+        Tuple of (file type, output path or None, errors reported by the compressor)
+    """
+    errors = []
+    ftype = ftype or get_file_type(file_path)
+    compress = _FILE_COMPRESSORS.get(ftype)
+    output_path = compress(file_path, out_dir, jpeg_quality, pdf_quality, errors) if compress else None
+    return ftype, output_path, errors
+
+def compress_pdf_batch(pdf_paths: List[str], out_dir: Optional[str],
+                       pdf_quality: str) -> Tuple[List[Optional[str]], List[str]]:
+    """
+    Compress several PDFs with a single Ghostscript run (see PDFCompressor.compress_batch).
+
+    Runs inside a worker process, so it must stay a module-level function.
+
+    Args:
+        pdf_paths: Input PDF paths
+        out_dir: Output directory (None to write next to the inputs)
+        pdf_quality: Ghostscript PDF quality preset (e.g. '/screen')
+
+    Returns:
+        Tuple of (output path or None for each input, errors reported by the compressor)
+    """
+    from compressors.pdf_compressor import PDFCompressor
+    errors = []
+    output_paths = PDFCompressor().compress_batch(pdf_paths, error_list=errors, out_dir=out_dir, quality=pdf_quality)
+    return output_paths, errors
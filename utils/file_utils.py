@@ -1,9 +1,11 @@
 import os
 import shutil
 import platform
-import pathlib
+import stat
+from functools import lru_cache
 from typing import List, Optional
 
+@lru_cache(maxsize=1)
 def get_ghostscript_path() -> str:
     """Get the path to Ghostscript executable."""
     gs_path = shutil.which('gs') or '/opt/homebrew/bin/gs'
@@ -11,32 +13,33 @@ def get_ghostscript_path() -> str:
         gs_path = shutil.which('gswin64c') or shutil.which('gswin32c') or gs_path
     return gs_path
 
+_SUPPORTED_EXTS = frozenset({'.docx', '.pdf', '.png', '.jpg', '.jpeg', '.heic', '.xlsx', '.xls', '.pptx', '.ppt'})
+
 def get_supported_extensions() -> List[str]:
     """Get list of supported file extensions."""
-    return ['.docx', '.pdf', '.png', '.jpg', '.jpeg', '.heic', '.xlsx', '.xls', '.pptx', '.ppt']
+    return list(_SUPPORTED_EXTS)
 
 def is_supported_file(file_path: str) -> bool:
     """Check if file is supported for compression."""
-    ext = os.path.splitext(file_path)[1].lower()
-    return ext in get_supported_extensions()
+    return os.path.splitext(file_path)[1].lower() in _SUPPORTED_EXTS
 
 def validate_file_path(file_path: str) -> bool:
     """Validate file path for security and existence."""
+    # One stat (following symlinks, like resolve()) answers both "exists" and "is a regular file"
     try:
-        path = pathlib.Path(file_path).resolve()
-        return path.exists() and path.is_file() and path.is_absolute()
-    except (OSError, ValueError, RuntimeError):
+        return stat.S_ISREG(os.stat(file_path).st_mode)
+    except (OSError, ValueError):
         return False
 
 def get_output_path(input_path: str, output_dir: Optional[str] = None, suffix: str = '_compressed') -> str:
     """Generate output path for compressed file."""
-    base_name = os.path.basename(input_path)
-    name, ext = os.path.splitext(base_name)
+    # Split the full path so the extension can't also match inside a directory name
+    root, ext = os.path.splitext(input_path)
     
     if output_dir:
-        return os.path.join(output_dir, f"{name}{suffix}{ext}")
+        return os.path.join(output_dir, f"{os.path.basename(root)}{suffix}{ext}")
     else:
-        return input_path.replace(ext, f"{suffix}{ext}")
+        return f"{root}{suffix}{ext}"
 
 def ensure_directory_exists(directory: str) -> bool:
     """Ensure directory exists, create if it doesn't."""
@@ -47,32 +50,37 @@ def ensure_directory_exists(directory: str) -> bool:
     except (OSError, PermissionError):
         return False
 
+_EXT_TO_TYPE = {
+    'docx': 'docx',
+    'pdf': 'pdf',
+    'jpg': 'image', 'jpeg': 'image', 'png': 'image', 'heic': 'image',
+    'xlsx': 'excel', 'xls': 'excel',
+    'pptx': 'ppt', 'ppt': 'ppt',
+}
+
 def get_file_type(path: str) -> Optional[str]:
     """Get file type based on extension."""
-    ext = os.path.splitext(path)[1].lower().replace('.', '')
-    if ext == 'docx':
-        return 'docx'
-    elif ext == 'pdf':
-        return 'pdf'
-    elif ext in ['jpg', 'jpeg', 'png', 'heic']:
-        return 'image'
-    elif ext in ['xlsx', 'xls']:
-        return 'excel'
-    elif ext in ['pptx', 'ppt']:
-        return 'ppt'
-    return None 
+    return _EXT_TO_TYPE.get(os.path.splitext(path)[1][1:].lower())
+
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '/\\:*?"<>|'})
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename to prevent path traversal attacks."""
-    # Remove any path separators and dangerous characters
-    dangerous_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
-    for char in dangerous_chars:
-        filename = filename.replace(char, '_')
-    return filename.strip()
+    # Replace any path separators and dangerous characters in one pass
+    return filename.translate(_SANITIZE_TABLE).strip()
+
+def stat_file(file_path: str) -> Optional[os.stat_result]:
+    """Stat a file once so callers can derive size, type and mtime without further syscalls."""
+    try:
+        return os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+
+def get_file_size_mb_from_stat(st: os.stat_result) -> float:
+    """Get file size in megabytes from an existing stat result."""
+    return st.st_size / (1024 * 1024)
 
 def get_file_size_mb(file_path: str) -> float:
     """Get file size in megabytes."""
-    try:
-        return os.path.getsize(file_path) / (1024 * 1024)
-    except (OSError, FileNotFoundError):
-        return 0.0 
\ No newline at end of file
+    st = stat_file(file_path)
+    return get_file_size_mb_from_stat(st) if st is not None else 0.0 
\ No newline at end of file
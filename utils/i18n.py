@@ -1,7 +1,8 @@
 import json
 import os
+import sys
 import locale
-from typing import Dict, Any
+from typing import Dict, Any, Set
 
 class I18nManager:
     """Internationalization manager for the application."""
@@ -9,61 +10,94 @@ class I18nManager:
     def __init__(self, default_language='en'):
         self.default_language = default_language
         self.current_language = default_language
+        # Loaded on first use; only the active and default languages are normally read
         self.translations = {}
         self.locales_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'locales')
-        self.load_translations()
+        self._available_langs = self._scan_locales()
+        self._ensure_loaded(self.default_language)
+        # Dicts for the active and fallback languages, so get_text does a single lookup
+        self._fallback_translations = self.translations.get(self.default_language, {})
+        self._active_translations = self._fallback_translations
     
     def get_system_language(self) -> str:
-        """Get the system's default language."""
+        """Get the system's default language as a lowercase code such as 'en'."""
         try:
-            system_locale = locale.getdefaultlocale()[0]
-            if system_locale:
-                # Extract language code (e.g., 'en_US' -> 'en')
-                return system_locale.split('_')[0]
-        except:
+            # The environment takes precedence, as it does for POSIX locales
+            candidates = [os.environ.get(name) for name in ('LC_ALL', 'LC_MESSAGES', 'LANG')]
+            if sys.platform == 'win32':
+                # The display language; getlocale() on Windows returns names such
+                # as 'English_United States' rather than codes
+                import ctypes
+                lang_id = ctypes.windll.kernel32.GetUserDefaultUILanguage()
+                candidates.append(locale.windows_locale.get(lang_id))
+            # getdefaultlocale() is deprecated
+            candidates.append(locale.getlocale()[0])
+            for system_locale in candidates:
+                language = self._normalize_language(system_locale)
+                if language:
+                    return language
+        except Exception:
             pass
         return self.default_language
     
-    def load_translations(self):
-        """Load all translation files."""
-        if not os.path.exists(self.locales_dir):
-            return
-        
-        for lang_dir in os.listdir(self.locales_dir):
-            lang_path = os.path.join(self.locales_dir, lang_dir)
-            if os.path.isdir(lang_path):
-                translation_file = os.path.join(lang_path, 'translations.json')
-                if os.path.exists(translation_file):
-                    try:
-                        with open(translation_file, 'r', encoding='utf-8') as f:
-                            self.translations[lang_dir] = json.load(f)
-                    except Exception as e:
-                        print(f"Error loading translations for {lang_dir}: {e}")
+    @staticmethod
+    def _normalize_language(system_locale) -> str:
+        """Extract the language code from a locale name (e.g. 'en_US.UTF-8' or 'English_United States' -> 'en')."""
+        if not system_locale or system_locale in ('C', 'POSIX'):
+            return ''
+        language = system_locale.split('.')[0].split('@')[0].replace('-', '_').split('_')[0].lower()
+        if len(language) > 3:
+            # A language name; map it through Python's locale aliases ('english' -> 'en_EN.ISO8859-1')
+            language = locale.normalize(language).split('_')[0].lower()
+        return language if language.isalpha() and 2 <= len(language) <= 3 else ''
+    
+    def _scan_locales(self) -> Set[str]:
+        """Find the language directories under locales_dir with a single directory scan."""
+        try:
+            with os.scandir(self.locales_dir) as it:
+                return {entry.name for entry in it if entry.is_dir()}
+        except OSError:
+            return set()
+    
+    def _ensure_loaded(self, language: str) -> bool:
+        """Load a language's translation file if it isn't loaded yet; return whether it is available."""
+        if language in self.translations:
+            return True
+        if language not in self._available_langs:
+            return False
+        translation_file = os.path.join(self.locales_dir, language, 'translations.json')
+        try:
+            with open(translation_file, 'r', encoding='utf-8') as f:
+                self.translations[language] = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Error loading translations for {language}: {e}")
+            return False
+        return True
     
     def set_language(self, language: str):
         """Set the current language."""
-        if language in self.translations:
+        if self._ensure_loaded(language):
             self.current_language = language
         else:
             print(f"Language '{language}' not found, using default")
             self.current_language = self.default_language
+        self._active_translations = self.translations.get(self.current_language, {})
     
     def get_text(self, key: str, **kwargs) -> str:
         """Get translated text for a given key."""
-        try:
-            # Try current language first
-            if self.current_language in self.translations:
-                text = self.translations[self.current_language].get(key, key)
-            else:
-                # Fallback to default language
-                text = self.translations.get(self.default_language, {}).get(key, key)
-            
-            # Replace placeholders if any
-            if kwargs:
-                text = text.format(**kwargs)
-            
+        # Try current language first, then fall back to default language
+        text = self._active_translations.get(key)
+        if text is None:
+            text = self._fallback_translations.get(key, key)
+        if not kwargs:
             return text
-        except Exception:
+        
+        # Replace placeholders if any
+        try:
+            return text.format(**kwargs)
+        except (KeyError, IndexError, ValueError):
             return key
     
     def get_available_languages(self) -> Dict[str, str]:
@@ -0,0 +1,19 @@
+"""
+JSON file helpers shared by the settings manager and the translation tool.
+"""
+
+import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads(data: bytes):
+    """Parse JSON bytes, with orjson when it is available."""
+    return orjson.loads(data) if orjson is not None else json.loads(data.decode('utf-8'))
+
+def dumps(data) -> bytes:
+    """Serialize to UTF-8 JSON bytes with 2-space indentation, keeping non-ASCII text readable."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
@@ -3,14 +3,22 @@ Logging configuration for the File Compressor application.
 """
 
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from typing import Optional
 
+# Background listener that owns the real handlers; see setup_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """
     Setup logging configuration for the application.
     
+    Records are put on a queue and written to the console and log files by a
+    background QueueListener, so logging threads never wait on file I/O.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
@@ -37,13 +45,15 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     logger.setLevel(getattr(logging, log_level.upper()))
     
     # Clear existing handlers
+    stop_logging()
     logger.handlers.clear()
+    handlers = []
         
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler (if specified)
     if log_file:
@@ -51,7 +61,7 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
             file_handler = logging.FileHandler(log_file, encoding='utf-8')
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
             print(f"Warning: Could not setup file logging: {e}")
     
@@ -61,12 +71,27 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
         error_handler = logging.FileHandler(Config.ERROR_LOG_FILE, encoding='utf-8')
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(formatter)
-        logger.addHandler(error_handler)
+        handlers.append(error_handler)
     except Exception as e:
         print(f"Warning: Could not setup error logging: {e}")
     
+    global _listener
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
     return logger
 
+def stop_logging() -> None:
+    """Flush queued log records and stop the background listener started by setup_logging."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -111,6 +136,3 @@ def log_file_validation(file_path: str, is_valid: bool, reason: Optional[str] =
         logger.debug(f"File validation passed: {file_path}")
     else:
         logger.warning(f"File validation failed: {file_path} - {reason}")
-
-# Initialize default logging
-setup_logging() 
\ No newline at end of file
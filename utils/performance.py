@@ -3,27 +3,60 @@ Performance monitoring utilities for the File Compressor application.
 """
 
 import time
-import psutil
 import os
+import itertools
 from typing import Dict, Any, Optional, Callable
 from functools import wraps
+from config import Config
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# psutil is imported on first use; building a psutil.Process re-reads /proc
+# metadata, so this process's handle is built once too
+_PROC = None
+_MB = 1 << 20
+_GB = 1 << 30
+# Minimum free memory and disk space for check_system_resources
+_MIN_FREE_MEMORY = 100 * _MB
+_MIN_FREE_DISK = _GB
+
+def _sample_rss() -> int:
+    """Read this process's resident set size in bytes."""
+    global _PROC
+    if _PROC is None:
+        import psutil
+        _PROC = psutil.Process(os.getpid())
+    # oneshot() lets any metric read alongside RSS share the same /proc reads. It
+    # caches for the whole block, so each sample gets its own block rather than
+    # one around the monitored call (which would freeze RSS at its start value)
+    with _PROC.oneshot():
+        return _PROC.memory_info().rss
+
+def _safe_size_mb(path) -> float:
+    """Get a file's size in MB with a single stat, or 0 if it can't be read."""
+    # Decorated functions aren't always called with a path first; skip the stat for those
+    if not isinstance(path, (str, bytes, os.PathLike)):
+        return 0
+    try:
+        return os.stat(path).st_size / _MB
+    except (OSError, ValueError):
+        return 0
+
 class PerformanceMonitor:
     """Monitor performance metrics during compression operations."""
     
     def __init__(self):
         self.metrics: Dict[str, Any] = {}
-        self.start_time: Optional[float] = None
-        self.start_memory: Optional[float] = None
+        self.start_time: Optional[int] = None  # perf_counter_ns() timestamp
+        self.start_memory: Optional[int] = None  # RSS in bytes
     
     def start_monitoring(self, operation_name: str) -> None:
         """Start monitoring an operation."""
-        self.start_time = time.time()
-        self.start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-        logger.info(f"Starting performance monitoring for: {operation_name}")
+        self.start_time = time.perf_counter_ns()
+        self.start_memory = _sample_rss()
+        # Per-operation logs are DEBUG with lazy arguments, so batches don't pay for them
+        logger.debug("Starting performance monitoring for: %s", operation_name)
     
     def stop_monitoring(self, operation_name: str, file_path: str, 
                        original_size: float, compressed_size: Optional[float] = None) -> Dict[str, Any]:
@@ -31,20 +64,23 @@ class PerformanceMonitor:
         if self.start_time is None:
             return {}
         
-        end_time = time.time()
-        end_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+        end_time = time.perf_counter_ns()
+        end_memory = _sample_rss()
         
-        duration = end_time - self.start_time
-        memory_used = end_memory - (self.start_memory or 0)
+        duration_ns = end_time - self.start_time
+        memory_bytes = end_memory - (self.start_memory or 0)
         
         metrics = {
             'operation': operation_name,
             'file_path': file_path,
-            'duration_seconds': round(duration, 2),
-            'memory_used_mb': round(memory_used, 2),
+            'duration_seconds': round(duration_ns / 1e9, 2),
+            'memory_used_mb': round(memory_bytes / _MB, 2),
             'original_size_mb': round(original_size, 2),
             'compressed_size_mb': round(compressed_size, 2) if compressed_size else None,
-            'compression_ratio': None
+            'compression_ratio': None,
+            # Unrounded values, so summaries don't accumulate rounding error
+            '_duration_ns': duration_ns,
+            '_memory_bytes': memory_bytes,
         }
         
         if compressed_size and original_size > 0:
@@ -54,10 +90,9 @@ class PerformanceMonitor:
         self.metrics[operation_name] = metrics
         
         # Log performance metrics
-        logger.info(f"Performance metrics for {operation_name}: "
-                   f"Duration: {metrics['duration_seconds']}s, "
-                   f"Memory: {metrics['memory_used_mb']}MB, "
-                   f"Compression: {metrics['compression_ratio']}%")
+        logger.debug("Performance metrics for %s: Duration: %ss, Memory: %sMB, Compression: %s%%",
+                     operation_name, metrics['duration_seconds'], metrics['memory_used_mb'],
+                     metrics['compression_ratio'])
         
         return metrics
     
@@ -66,41 +101,56 @@ class PerformanceMonitor:
         if not self.metrics:
             return {}
         
-        total_duration = sum(m['duration_seconds'] for m in self.metrics.values())
-        total_memory = sum(m['memory_used_mb'] for m in self.metrics.values())
-        total_files = len(self.metrics)
+        # One pass, accumulating integer nanoseconds and bytes
+        total_duration_ns = total_memory_bytes = 0
+        ratio_sum = 0.0
+        ratio_count = 0
+        for m in self.metrics.values():
+            total_duration_ns += m['_duration_ns']
+            total_memory_bytes += m['_memory_bytes']
+            if m['compression_ratio'] is not None:
+                ratio_sum += m['compression_ratio']
+                ratio_count += 1
         
-        avg_compression_ratio = 0
-        compression_ratios = [m['compression_ratio'] for m in self.metrics.values() 
-                            if m['compression_ratio'] is not None]
-        if compression_ratios:
-            avg_compression_ratio = sum(compression_ratios) / len(compression_ratios)
+        total_files = len(self.metrics)
+        total_duration = total_duration_ns / 1e9
+        total_memory = total_memory_bytes / _MB
+        avg_compression_ratio = ratio_sum / ratio_count if ratio_count else 0
         
         return {
             'total_files_processed': total_files,
             'total_duration_seconds': round(total_duration, 2),
             'total_memory_used_mb': round(total_memory, 2),
             'average_compression_ratio': round(avg_compression_ratio, 1),
-            'average_duration_per_file': round(total_duration / total_files, 2) if total_files > 0 else 0
+            'average_duration_per_file': round(total_duration / total_files, 2)
         }
 
-def monitor_performance(operation_name: str):
-    """Decorator to monitor performance of compression functions."""
+def monitor_performance(operation_name: str, sample_rate: Optional[int] = None):
+    """
+    Decorator to monitor performance of compression functions.
+
+    Args:
+        operation_name: Name the metrics are recorded under
+        sample_rate: Instrument 1 in this many calls (defaults to Config.PROFILE_SAMPLE_RATE)
+    """
+    rate = max(1, sample_rate or Config.PROFILE_SAMPLE_RATE)
+
     def decorator(func: Callable) -> Callable:
+        call_counter = itertools.count()
+
         @wraps(func)
         def wrapper(*args, **kwargs):
+            # Unsampled calls skip the stat and timing work entirely
+            if next(call_counter) % rate:
+                return func(*args, **kwargs)
+
             monitor = PerformanceMonitor()
             
             # Extract file path from arguments
             file_path = args[0] if args else kwargs.get('file_path', 'unknown')
             
             # Get original file size
-            original_size = 0
-            try:
-                if os.path.exists(file_path):
-                    original_size = os.path.getsize(file_path) / 1024 / 1024  # MB
-            except (OSError, TypeError):
-                pass
+            original_size = _safe_size_mb(file_path)
             
             # Start monitoring
             monitor.start_monitoring(operation_name)
@@ -110,12 +160,7 @@ def monitor_performance(operation_name: str):
                 result = func(*args, **kwargs)
                 
                 # Get compressed file size if result is a path
-                compressed_size = None
-                if result and isinstance(result, str) and os.path.exists(result):
-                    try:
-                        compressed_size = os.path.getsize(result) / 1024 / 1024  # MB
-                    except OSError:
-                        pass
+                compressed_size = _safe_size_mb(result) if result and isinstance(result, str) else None
                 
                 # Stop monitoring
                 monitor.stop_monitoring(operation_name, file_path, original_size, compressed_size)
@@ -130,20 +175,33 @@ def monitor_performance(operation_name: str):
         return wrapper
     return decorator
 
+# How long a memory/disk reading is reused, so back-to-back checks share one
+_RESOURCE_SNAPSHOT_TTL = 1.0
+_resource_snapshot = None  # (monotonic timestamp, virtual_memory(), disk_usage('/'))
+
+def _get_resource_snapshot():
+    """Get psutil's virtual memory and root disk usage, re-read at most once per TTL."""
+    global _resource_snapshot
+    now = time.monotonic()
+    if _resource_snapshot is None or now - _resource_snapshot[0] >= _RESOURCE_SNAPSHOT_TTL:
+        import psutil
+        _resource_snapshot = (now, psutil.virtual_memory(), psutil.disk_usage('/'))
+    return _resource_snapshot[1], _resource_snapshot[2]
+
 def get_system_info() -> Dict[str, Any]:
     """Get system information for performance analysis."""
     try:
+        import psutil
         cpu_count = psutil.cpu_count()
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        memory, disk = _get_resource_snapshot()
         
         return {
             'cpu_count': cpu_count,
-            'memory_total_gb': round(memory.total / 1024 / 1024 / 1024, 2),
-            'memory_available_gb': round(memory.available / 1024 / 1024 / 1024, 2),
+            'memory_total_gb': round(memory.total / _GB, 2),
+            'memory_available_gb': round(memory.available / _GB, 2),
             'memory_percent_used': round(memory.percent, 1),
-            'disk_total_gb': round(disk.total / 1024 / 1024 / 1024, 2),
-            'disk_free_gb': round(disk.free / 1024 / 1024 / 1024, 2),
+            'disk_total_gb': round(disk.total / _GB, 2),
+            'disk_free_gb': round(disk.free / _GB, 2),
             'disk_percent_used': round((disk.used / disk.total) * 100, 1)
         }
     except Exception as e:
@@ -153,12 +211,11 @@ def get_system_info() -> Dict[str, Any]:
 def check_system_resources() -> Dict[str, bool]:
     """Check if system has sufficient resources for compression."""
     try:
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        memory, disk = _get_resource_snapshot()
         
         # Check if we have at least 100MB free memory and 1GB free disk space
-        memory_ok = memory.available > 100 * 1024 * 1024  # 100MB
-        disk_ok = disk.free > 1024 * 1024 * 1024  # 1GB
+        memory_ok = memory.available > _MIN_FREE_MEMORY
+        disk_ok = disk.free > _MIN_FREE_DISK
         
         return {
             'memory_sufficient': memory_ok,
@@ -172,6 +229,3 @@ def check_system_resources() -> Dict[str, bool]:
             'disk_sufficient': False,
             'system_ready': False
         }
-
-# Global performance monitor instance
-performance_monitor = PerformanceMonitor() 
\ No newline at end of file
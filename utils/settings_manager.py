@@ -2,21 +2,12 @@
 Settings manager for persistent application configuration.
 """
 
-import json
 import os
 import logging
 from typing import Dict, Any, Optional
 from config import Config
+from utils import jsonio
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(Config.LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 # Determine user-writable settings path (macOS convention)
@@ -34,11 +25,15 @@ class SettingsManager:
     """Manages persistent application settings."""
     
     def __init__(self, config_file: Optional[str] = None):
+        # Set when settings have changed since they were last saved
+        self._dirty = False
         try:
             if config_file is None:
                 config_file = get_default_settings_path()
             self.config_file = config_file
-            logger.info(f"SettingsManager using config file: {os.path.abspath(self.config_file)}")
+            # Only used in log messages; resolved once rather than per read/write
+            self._abs_path = os.path.abspath(self.config_file)
+            logger.info(f"SettingsManager using config file: {self._abs_path}")
             self.settings = self.load_settings()
         except Exception as e:
             logger.error(f"Exception in SettingsManager: {e}")
@@ -46,11 +41,13 @@ class SettingsManager:
     
     def load_settings(self) -> Dict[str, Any]:
         """Load settings from file or return defaults."""
+        # Open directly instead of checking existence first
         try:
-            if os.path.exists(self.config_file):
-                logger.info(f"Loading settings from: {os.path.abspath(self.config_file)}")
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            with open(self.config_file, 'rb') as f:
+                logger.info(f"Loading settings from: {self._abs_path}")
+                return jsonio.loads(f.read())
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Exception loading settings: {e}")
         # Return default settings if anything fails
@@ -58,13 +55,21 @@ class SettingsManager:
     
     def save_settings(self, settings: Dict[str, Any]) -> bool:
         """Save settings to file."""
+        # Write a temporary file and rename it over the old one, so a failed
+        # write never leaves a truncated settings file behind
+        tmp_file = self.config_file + '.tmp'
         try:
-            logger.info(f"Saving settings to: {os.path.abspath(self.config_file)}")
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            logger.info(f"Saving settings to: {self._abs_path}")
+            with open(tmp_file, 'wb') as f:
+                f.write(jsonio.dumps(settings))
+            os.replace(tmp_file, self.config_file)
             return True
         except IOError as e:
-            logger.error(f"Error saving settings to {os.path.abspath(self.config_file)}: {e}")
+            logger.error(f"Error saving settings to {self._abs_path}: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
             return False
     
     def get_default_settings(self) -> Dict[str, Any]:
@@ -79,24 +84,42 @@ class SettingsManager:
             'language': 'en'
         }
     
+    def get_all(self) -> Dict[str, Any]:
+        """Get a snapshot of all settings, with defaults filled in for missing keys."""
+        settings = self.get_default_settings()
+        settings.update(self.settings)
+        return settings
+    
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a specific setting value."""
         return self.settings.get(key, default)
     
     def set_setting(self, key: str, value: Any) -> bool:
-        """Set a specific setting value."""
+        """Set a specific setting value; it is written on the next flush()."""
         self.settings[key] = value
-        return self.save_settings(self.settings)
+        self._dirty = True
+        return True
     
     def update_settings(self, new_settings: Dict[str, Any]) -> bool:
-        """Update multiple settings at once."""
+        """Update multiple settings at once and save them, with any deferred changes."""
         self.settings.update(new_settings)
-        return self.save_settings(self.settings)
+        self._dirty = True
+        return self.flush()
     
     def reset_to_defaults(self) -> bool:
         """Reset all settings to defaults."""
         self.settings = self.get_default_settings()
-        return self.save_settings(self.settings)
+        self._dirty = True
+        return self.flush()
+    
+    def flush(self) -> bool:
+        """Write settings changed since the last save; returns False if the write failed."""
+        if not self._dirty:
+            return True
+        if not self.save_settings(self.settings):
+            return False
+        self._dirty = False
+        return True
     
     def get_jpeg_quality(self) -> int:
         """Get JPEG quality setting."""
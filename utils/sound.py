@@ -1,8 +1,68 @@
+import ctypes
+import shutil
 import subprocess
+import sys
+import time
+
+_SUCCESS_SOUND = '/System/Library/Sounds/Glass.aiff'
+# Resolved once so each call skips the PATH lookup
+_AFPLAY = shutil.which('afplay')
+# Calls closer together than this (e.g. several batches finishing at once) play one sound
+_MIN_INTERVAL = 0.2
+_last_played = None
+
+def _load_system_sound():
+    """
+    Register the success sound with AudioToolbox so it plays in-process.
+
+    Returns:
+        (AudioServicesPlaySystemSound, SystemSoundID), or None if unavailable (e.g. not macOS)
+    """
+    if sys.platform != 'darwin':
+        return None
+    try:
+        cf = ctypes.CDLL('/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation')
+        audio = ctypes.CDLL('/System/Library/Frameworks/AudioToolbox.framework/AudioToolbox')
+        cf.CFURLCreateFromFileSystemRepresentation.restype = ctypes.c_void_p
+        cf.CFURLCreateFromFileSystemRepresentation.argtypes = [ctypes.c_void_p, ctypes.c_char_p,
+                                                               ctypes.c_long, ctypes.c_bool]
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+        audio.AudioServicesCreateSystemSoundID.restype = ctypes.c_int32  # OSStatus
+        audio.AudioServicesCreateSystemSoundID.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)]
+        audio.AudioServicesPlaySystemSound.restype = None
+        audio.AudioServicesPlaySystemSound.argtypes = [ctypes.c_uint32]
+
+        path = _SUCCESS_SOUND.encode('utf-8')
+        url = cf.CFURLCreateFromFileSystemRepresentation(None, path, len(path), False)
+        if not url:
+            return None
+        sound_id = ctypes.c_uint32()
+        try:
+            status = audio.AudioServicesCreateSystemSoundID(url, ctypes.byref(sound_id))
+        finally:
+            cf.CFRelease(url)
+        if status != 0:
+            return None
+        return audio.AudioServicesPlaySystemSound, sound_id.value
+    except (OSError, AttributeError):
+        return None
+
+# Loaded once at import; playing is then a single non-blocking call
+_SYSTEM_SOUND = _load_system_sound()
 
 def play_success_sound():
-    """Play a success sound (macOS system sound)."""
+    """Play a success sound (macOS system sound) without waiting for it to finish."""
+    global _last_played
+    now = time.monotonic()
+    if _last_played is not None and now - _last_played < _MIN_INTERVAL:
+        return
+    _last_played = now
     try:
-        subprocess.run(['afplay', '/System/Library/Sounds/Glass.aiff'])
+        if _SYSTEM_SOUND is not None:
+            play, sound_id = _SYSTEM_SOUND
+            play(sound_id)
+        elif _AFPLAY is not None:
+            subprocess.Popen([_AFPLAY, _SUCCESS_SOUND], stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, start_new_session=True)
     except Exception:
-        pass 
\ No newline at end of file
+        pass